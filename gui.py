@@ -10,8 +10,10 @@ import logging
 import subprocess
 import re
 import shutil
+import functools
 from urllib.parse import urlparse, parse_qs
 import threading
+import queue
 import time
 import warnings
 import webbrowser
@@ -30,13 +32,11 @@ if getattr(sys, 'frozen', False):
 else:
     _base_dir = os.path.dirname(__file__)
 _env_path = os.path.join(_base_dir, ".env")
+# KEY=value per line; blank lines and # comments never match the anchor
+_ENV_LINE_RE = re.compile(r"^[ \t]*([^#=\s][^=\s]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.M)
 if os.path.exists(_env_path):
-    with open(_env_path, encoding="utf-8") as _ef:
-        for _line in _ef:
-            _line = _line.strip()
-            if _line and not _line.startswith("#") and "=" in _line:
-                _k, _v = _line.split("=", 1)
-                os.environ.setdefault(_k.strip(), _v.strip())
+    for _k, _v in _ENV_LINE_RE.findall(Path(_env_path).read_text(encoding="utf-8", errors="replace")):
+        os.environ.setdefault(_k, _v)
 
 import customtkinter as ctk
 import tkinter.font as tkfont
@@ -51,6 +51,18 @@ try:
 except ImportError:
     _HAS_DND = False
 
+# Optional: orjson for faster tracks.json encode/decode (stdlib json fallback)
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    _json_loads = json.loads
+
 # Monkey-patch: soundfile 0.13+ removed SoundFileRuntimeError but librosa still expects it
 import soundfile as _sf
 if not hasattr(_sf, 'SoundFileRuntimeError'):
@@ -84,6 +96,17 @@ UPLOAD_HISTORY_FILE = "upload_history.json"
 os.makedirs(DOWNLOADS_FOLDER, exist_ok=True)
 os.makedirs(OUTPUTS_FOLDER, exist_ok=True)
 
+# Platform dropdown label → compose_complete_short platform key
+_PLATFORM_KEYS = {"TikTok": "tiktok", "Reels": "reels", "YouTube Shorts": "youtube-short"}
+
+# Upload result row style: status → (prefix, text color)
+_STATUS_STYLE = {
+    UploadStatus.SUCCESS: ("[OK]", "#2ecc71"),
+    UploadStatus.FAILED: ("[FAIL]", "#e74c3c"),
+    UploadStatus.PENDING: ("[...]", "gray"),
+    UploadStatus.UPLOADING: ("[...]", "#f39c12"),
+}
+
 LOG_FILE = os.path.join(OUTPUTS_FOLDER, "hook-to-short.log")
 _file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8", mode="w")
 _file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
@@ -103,16 +126,28 @@ logger = logging.getLogger(__name__)
 # Track persistence (same format as app.py)
 # ---------------------------------------------------------------------------
 
+# Parsed tracks.json, reused while the file's mtime is unchanged.
+# Callers get copies, so editing a loaded list never leaks into the cache.
+_tracks_cache = {"mtime": 0.0, "data": []}
+
+
 def load_tracks() -> list:
-    if os.path.exists(TRACKS_DB):
-        with open(TRACKS_DB, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return []
+    try:
+        mtime = os.path.getmtime(TRACKS_DB)
+    except OSError:
+        return []
+    if mtime != _tracks_cache["mtime"]:
+        with open(TRACKS_DB, "rb") as f:
+            _tracks_cache["data"] = _json_loads(f.read())
+        _tracks_cache["mtime"] = mtime
+    return [dict(t) for t in _tracks_cache["data"]]
 
 
 def save_tracks(tracks: list):
-    with open(TRACKS_DB, "w", encoding="utf-8") as f:
-        json.dump(tracks, f, ensure_ascii=False, indent=2)
+    with open(TRACKS_DB, "wb") as f:
+        f.write(_json_dumps(tracks))
+    _tracks_cache["mtime"] = os.path.getmtime(TRACKS_DB)
+    _tracks_cache["data"] = [dict(t) for t in tracks]
 
 
 def add_track(track_info: dict) -> dict:
@@ -182,22 +217,79 @@ def sync_tracks_with_folder():
     return surviving
 
 
-def _cleanup_temp_hooks():
-    """Remove leftover _tmp_hook_*.wav files from outputs."""
-    for f in glob_mod.glob(os.path.join(OUTPUTS_FOLDER, "_tmp_hook_*.wav")):
-        try:
-            os.remove(f)
-            logger.info(f"Cleaned up temp file: {os.path.basename(f)}")
-        except OSError:
-            pass
+# ---------------------------------------------------------------------------
+# Metadata / mood (pure on their inputs — cached per process)
+# ---------------------------------------------------------------------------
+
+_mood_detector: Optional[MoodDetector] = None
+
+
+def _get_mood_detector() -> MoodDetector:
+    global _mood_detector
+    if _mood_detector is None:
+        _mood_detector = MoodDetector()
+    return _mood_detector
+
+
+_kie_generator: Optional[KieAIGenerator] = None
+
+
+def _get_kie_generator() -> KieAIGenerator:
+    """Shared generator — rebuilt only when KIE_API_KEY changes in Settings."""
+    global _kie_generator
+    key = os.environ.get("KIE_API_KEY", "")
+    if _kie_generator is None or _kie_generator.api_key != key:
+        _kie_generator = KieAIGenerator()
+    return _kie_generator
 
 
-def _cleanup_temp_folders():
-    """Remove leftover temp_* directories from downloads."""
+_parse_title = functools.lru_cache(maxsize=256)(extract_metadata_from_title)
+
+
+@functools.lru_cache(maxsize=256)
+def _detect_mood(artist: str, title: str) -> dict:
+    return _get_mood_detector().detect_from_artist_title(artist, title)
+
+
+@functools.lru_cache(maxsize=32)
+def _preview_thumb(path: str, mtime: float, height: int) -> PILImage.Image:
+    """Decoded + downscaled album art; mtime in the key drops stale entries."""
+    img = PILImage.open(path)
+    img.thumbnail((10000, height), PILImage.Resampling.LANCZOS)
+    return img
+
+
+def _filename_to_title(fname: str) -> str:
+    """Video filename → upload title ("My_Song_short.mp4" → "My Song")."""
+    return fname.removesuffix("_short.mp4").replace("_", " ")
+
+
+def _cleanup_temp_hooks(before: Optional[float] = None):
+    """Remove leftover _tmp_hook_*.wav files from outputs.
+
+    before: only remove files last modified before this timestamp
+    (startup cleanup runs in the background alongside a possible generate).
+    """
+    with os.scandir(OUTPUTS_FOLDER) as it:
+        for entry in it:
+            if entry.name.startswith("_tmp_hook_") and entry.name.endswith(".wav"):
+                try:
+                    if before is not None and entry.stat().st_mtime >= before:
+                        continue
+                    os.remove(entry.path)
+                    logger.info(f"Cleaned up temp file: {entry.name}")
+                except OSError:
+                    pass
+
+
+def _cleanup_temp_folders(before: Optional[float] = None):
+    """Remove leftover temp_* directories from downloads (before: see _cleanup_temp_hooks)."""
     import shutil
     for d in glob_mod.glob(os.path.join(DOWNLOADS_FOLDER, "temp_*")):
         if os.path.isdir(d):
             try:
+                if before is not None and os.path.getmtime(d) >= before:
+                    continue
                 shutil.rmtree(d)
                 logger.info(f"Cleaned up temp folder: {os.path.basename(d)}")
             except OSError:
@@ -230,6 +322,7 @@ def add_upload_record(video_filename: str, results: list):
             "status": r.status.value,
             "url": r.url or "",
             "error": r.error or "",
+            "attempts": r.attempts,
         })
     save_upload_history(history)
 
@@ -257,9 +350,13 @@ class HookToShortApp(ctk.CTk):
     def __init__(self):
         super().__init__()
 
-        # Clean up leftover temp files on startup
-        _cleanup_temp_hooks()
-        _cleanup_temp_folders()
+        # Clean up leftover temp files on startup — in the background so the
+        # window paints first; anything created after launch is left alone
+        started = time.time()
+        threading.Thread(
+            target=lambda: (_cleanup_temp_hooks(before=started), _cleanup_temp_folders(before=started)),
+            daemon=True,
+        ).start()
 
         self.title("Hook-to-Short")
         self.geometry("780x750")
@@ -270,7 +367,7 @@ class HookToShortApp(ctk.CTk):
 
         # --- Thai-compatible font ---
         _preferred = ("Leelawadee UI", "Tahoma")
-        _available = set(tkfont.families())
+        _available = tkfont.families()  # tuple — only 2 preferences, no set needed
         self._thai_family = next((f for f in _preferred if f in _available), None)
         if self._thai_family:
             for name in ("TkDefaultFont", "TkTextFont", "TkMenuFont",
@@ -281,8 +378,16 @@ class HookToShortApp(ctk.CTk):
                 except Exception:
                     pass
 
+        # One CTkFont per (size, weight), shared by every widget that asks for it
+        self._font_cache: dict[tuple[int, str], ctk.CTkFont] = {}
+
         def _font(size: int = 13, weight: str = "normal") -> ctk.CTkFont:
-            return ctk.CTkFont(family=self._thai_family, size=size, weight=weight)
+            key = (size, weight)
+            f = self._font_cache.get(key)
+            if f is None:
+                f = ctk.CTkFont(family=self._thai_family, size=size, weight=weight)
+                self._font_cache[key] = f
+            return f
 
         self._font = _font
 
@@ -305,11 +410,20 @@ class HookToShortApp(ctk.CTk):
         self.auto_upload_var = ctk.BooleanVar(value=False)
         self._preview_hook_process = None
 
+        # Uploads run one at a time on a persistent worker thread
+        self._upload_queue: queue.Queue = queue.Queue()  # (fn, args)
+        self._upload_worker = threading.Thread(target=self._upload_worker_loop, daemon=True)
+        self._upload_worker.start()
+
         self._build_download_tab()
         self._build_library_tab()
         self._build_create_tab()
         self._build_upload_tab()
-        self._build_settings_tab()
+
+        # Settings tab is only built when first opened
+        self._built_tabs: set[str] = set()
+        self._lazy_tabs = {"ตั้งค่า": self._build_settings_tab}
+        self.tabview.configure(command=self._on_tab_changed)
 
         # --- Load saved settings ---
         self._load_user_settings()
@@ -360,24 +474,66 @@ class HookToShortApp(ctk.CTk):
             except Exception:
                 pass  # DnD not compatible — file dialog still works
 
+        # Warm up the generate pipeline while the user picks a song
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    @staticmethod
+    def _warmup():
+        """Pre-import the hook extractor (librosa/pychorus) and build shared helpers."""
+        try:
+            _get_mood_detector()
+            _get_kie_generator()
+            import python.main  # noqa: F401
+            import pychorus.helpers  # noqa: F401 — heavy audio imports, cached in sys.modules
+        except Exception as e:
+            logger.debug(f"Warmup skipped: {e}")
+
+    def _on_tab_changed(self):
+        name = self.tabview.get()
+        build = self._lazy_tabs.get(name)
+        if build is None or name in self._built_tabs:
+            return
+        self._built_tabs.add(name)
+        build()
+
     # -----------------------------------------------------------------------
     # Log helpers
     # -----------------------------------------------------------------------
 
     def _setup_log_handler(self):
         """Route all Python logging to the UI log panel."""
+        # Records are queued and flushed on one timer, not one after() per record
+        self._log_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._log_drain_scheduled = False
+
         class _TkHandler(logging.Handler):
             def __init__(self, app):
                 super().__init__()
                 self.app = app
             def emit(self, record):
-                msg = self.format(record)
-                self.app.after(0, lambda m=msg: self.app._append_log(m))
+                self.app._log_q.put(self.format(record))
+                if not self.app._log_drain_scheduled:
+                    self.app._log_drain_scheduled = True
+                    self.app.after(50, self.app._drain_log)
 
         handler = _TkHandler(self)
         handler.setFormatter(logging.Formatter("%(asctime)s  %(levelname)s  %(message)s", datefmt="%H:%M:%S"))
         logging.getLogger().addHandler(handler)
 
+    def _drain_log(self, max_lines: int = 200):
+        self._log_drain_scheduled = False
+        lines = []
+        while len(lines) < max_lines:
+            try:
+                lines.append(self._log_q.get_nowait())
+            except queue.Empty:
+                break
+        if lines:
+            self._append_log("\n".join(lines))
+        if not self._log_q.empty() and not self._log_drain_scheduled:
+            self._log_drain_scheduled = True
+            self.after(50, self._drain_log)
+
     def _append_log(self, text: str):
         self.log_box.configure(state="normal")
         self.log_box.insert("end", text + "\n")
@@ -545,47 +701,61 @@ class HookToShortApp(ctk.CTk):
                 os.makedirs(temp_folder, exist_ok=True)
                 output_template = os.path.join(temp_folder, "%(title)s.%(ext)s")
 
-                # Get channel/artist name first
-                artist_cmd = [
-                    sys.executable, "-m", "yt_dlp",
-                    "--print", "channel",
-                    "--no-playlist",
-                    url,
-                ]
-                artist_result = subprocess.run(artist_cmd, capture_output=True, text=True, timeout=30)
-                artist_name = artist_result.stdout.strip() if artist_result.returncode == 0 else ""
-
-                cmd = [
-                    sys.executable, "-m", "yt_dlp",
-                    "-f", "bestaudio",
-                    "-x",
-                    "--audio-format", "mp3",
-                    "--audio-quality", "192K",
-                    "-o", output_template,
-                    "--no-playlist",
-                    url,
-                ]
+                last_pct = [-1]
 
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+                def _yt_hook(d):
+                    if d.get("status") != "downloading":
+                        return
+                    total = d.get("total_bytes") or d.get("total_bytes_estimate")
+                    if not total:
+                        return
+                    pct = int(d.get("downloaded_bytes", 0) * 100 / total)
+                    if pct != last_pct[0]:  # only post when the shown number changes
+                        last_pct[0] = pct
+                        self.after(0, lambda p=pct: self.dl_progress.configure(
+                            text=f"กำลังดาวน์โหลด... {p}%"))
+
+                ydl_opts = {
+                    "format": "bestaudio",
+                    "outtmpl": output_template,
+                    "noplaylist": True,
+                    "quiet": True,
+                    "no_warnings": True,
+                    "socket_timeout": 30,
+                    "postprocessors": [{
+                        "key": "FFmpegExtractAudio",
+                        "preferredcodec": "mp3",
+                        "preferredquality": "192",
+                    }],
+                    "progress_hooks": [_yt_hook],
+                }
 
-                if result.returncode != 0:
-                    self.after(0, lambda: self._dl_done(None, f"ดาวน์โหลดไม่สำเร็จ:\n{result.stderr[:300]}"))
+                # One extractor pass gives both the channel name and the audio file
+                from yt_dlp import YoutubeDL
+                from yt_dlp.utils import DownloadError
+                try:
+                    with YoutubeDL(ydl_opts) as ydl:
+                        info = ydl.extract_info(url, download=True)
+                        downloaded = os.path.splitext(ydl.prepare_filename(info))[0] + ".mp3"
+                except DownloadError as e:
+                    self.after(0, lambda e=e: self._dl_done(None, f"ดาวน์โหลดไม่สำเร็จ:\n{str(e)[:300]}"))
                     return
 
-                mp3_files = [f for f in os.listdir(temp_folder) if f.endswith(".mp3")]
-                if not mp3_files:
+                artist_name = info.get("channel") or ""
+
+                # One stat both checks the MP3 exists and gives its size (rename keeps it)
+                try:
+                    file_size = os.stat(downloaded).st_size / (1024 * 1024)
+                except FileNotFoundError:
                     self.after(0, lambda: self._dl_done(None, "ไม่พบไฟล์ MP3 หลังดาวน์โหลด"))
                     return
 
-                mp3_file = mp3_files[0]
-                song_title = mp3_file.replace(".mp3", "")
+                song_title = info.get("title") or os.path.basename(downloaded)[:-len(".mp3")]
                 safe_name = self._sanitize_filename(song_title) + ".mp3"
                 final_path = os.path.join(DOWNLOADS_FOLDER, safe_name)
-                os.replace(os.path.join(temp_folder, mp3_file), final_path)
+                os.replace(downloaded, final_path)
                 _cleanup_temp_folders()
 
-                file_size = os.path.getsize(final_path) / (1024 * 1024)
-
                 track_info = {
                     "title": song_title,
                     "youtube_url": url,
@@ -599,8 +769,6 @@ class HookToShortApp(ctk.CTk):
 
                 self.after(0, lambda: self._dl_done(track_info, None))
 
-            except subprocess.TimeoutExpired:
-                self.after(0, lambda: self._dl_done(None, "ดาวน์โหลดหมดเวลา (5 นาที)"))
             except Exception as e:
                 self.after(0, lambda: self._dl_done(None, str(e)))
 
@@ -882,8 +1050,9 @@ class HookToShortApp(ctk.CTk):
                             it, f"[ไม่สำเร็จ — {it['error'][:60]}]", "#e74c3c"))
                         continue
 
-                    mp3_files = [f for f in os.listdir(temp_folder) if f.endswith(".mp3")]
-                    if not mp3_files:
+                    with os.scandir(temp_folder) as it:
+                        mp3_file = next((e.name for e in it if e.name.endswith(".mp3")), None)
+                    if not mp3_file:
                         logger.warning(f"Batch skip: {vid['title']} — ไม่พบไฟล์ MP3")
                         item["status"] = "failed"
                         item["error"] = "ไม่พบไฟล์ MP3"
@@ -891,7 +1060,6 @@ class HookToShortApp(ctk.CTk):
                             it, f"[ไม่สำเร็จ — {it['error']}]", "#e74c3c"))
                         continue
 
-                    mp3_file = mp3_files[0]
                     song_title = mp3_file.replace(".mp3", "")
                     final_path = os.path.join(DOWNLOADS_FOLDER, mp3_file)
                     os.replace(os.path.join(temp_folder, mp3_file), final_path)
@@ -1026,6 +1194,8 @@ class HookToShortApp(ctk.CTk):
 
         self.lib_scroll = ctk.CTkScrollableFrame(tab)
         self.lib_scroll.pack(fill="both", expand=True, padx=8, pady=4)
+        self._lib_rows: list[dict] = []  # reused row widgets, in display order
+        self._lib_empty_label: Optional[ctk.CTkLabel] = None
 
         self._refresh_library()
 
@@ -1144,9 +1314,6 @@ class HookToShortApp(ctk.CTk):
         self._lib_search_after_id = self.after(250, self._refresh_library)
 
     def _refresh_library(self):
-        for widget in self.lib_scroll.winfo_children():
-            widget.destroy()
-
         tracks = sync_tracks_with_folder()
         total = len(tracks)
 
@@ -1156,6 +1323,8 @@ class HookToShortApp(ctk.CTk):
             tracks = [t for t in tracks
                       if query in t.get("title", "").lower()
                       or query in t.get("artist", "").lower()]
+        else:
+            tracks = list(tracks)  # sorted below — keep the cached list's order intact
 
         # Apply sort
         sort_mode = self.lib_sort_var.get()
@@ -1176,48 +1345,77 @@ class HookToShortApp(ctk.CTk):
         else:
             self.lib_count_label.configure(text=f"เพลง: {total} เพลง")
 
+        # Drop surplus rows from the tail; existing rows are re-labelled in place
+        while len(self._lib_rows) > shown:
+            self._lib_rows.pop()["frame"].destroy()
+
         if not tracks:
             msg = "ไม่พบเพลงที่ตรงกับคำค้นหา" if query else "ยังไม่มีเพลง ลองดาวน์โหลดเพลงก่อน!"
-            ctk.CTkLabel(self.lib_scroll, text=msg,
-                         font=self._font(13)).pack(pady=20)
+            if self._lib_empty_label is None:
+                self._lib_empty_label = ctk.CTkLabel(self.lib_scroll, text=msg, font=self._font(13))
+            self._lib_empty_label.configure(text=msg)
+            self._lib_empty_label.pack(pady=20)
             return
+        if self._lib_empty_label is not None:
+            self._lib_empty_label.pack_forget()
 
-        for track in tracks:
-            row = ctk.CTkFrame(self.lib_scroll)
-            row.pack(fill="x", pady=2)
-
-            text_frame = ctk.CTkFrame(row, fg_color="transparent")
-            text_frame.pack(side="left", fill="x", expand=True, padx=6, pady=4)
-
+        for idx, track in enumerate(tracks):
             title = track.get('title', '?')
             if len(title) > 60:
                 title = title[:57] + "..."
-            ctk.CTkLabel(text_frame, text=title, anchor="w",
-                         font=self._font(13, "bold")).pack(anchor="w")
-
             sub = (
                 f"{track.get('artist', 'ไม่ทราบ')}  |  "
                 f"{track.get('file_size_mb', '?')} MB  |  "
                 f"{track.get('created_at', '')[:10]}"
             )
-            ctk.CTkLabel(text_frame, text=sub, anchor="w",
-                         font=self._font(11), text_color="gray").pack(anchor="w")
-
             track_id = track.get("id")
+
+            if idx < len(self._lib_rows):
+                row = self._lib_rows[idx]
+                if row["id"] == track_id and row["text"] == (title, sub):
+                    continue
+                row["title"].configure(text=title)
+                row["sub"].configure(text=sub)
+                row["del_btn"].configure(command=lambda tid=track_id: self._delete_track(tid))
+                row["rename_btn"].configure(command=lambda tid=track_id: self._rename_track(tid))
+                row["id"] = track_id
+                row["text"] = (title, sub)
+                continue
+
+            frame = ctk.CTkFrame(self.lib_scroll)
+            frame.pack(fill="x", pady=2)
+
+            text_frame = ctk.CTkFrame(frame, fg_color="transparent")
+            text_frame.pack(side="left", fill="x", expand=True, padx=6, pady=4)
+
+            title_label = ctk.CTkLabel(text_frame, text=title, anchor="w",
+                                       font=self._font(13, "bold"))
+            title_label.pack(anchor="w")
+
+            sub_label = ctk.CTkLabel(text_frame, text=sub, anchor="w",
+                                     font=self._font(11), text_color="gray")
+            sub_label.pack(anchor="w")
+
             del_btn = ctk.CTkButton(
-                row, text="ลบ", width=60, fg_color="#c0392b", hover_color="#e74c3c",
+                frame, text="ลบ", width=60, fg_color="#c0392b", hover_color="#e74c3c",
                 font=self._font(13),
                 command=lambda tid=track_id: self._delete_track(tid),
             )
             del_btn.pack(side="right", padx=4, pady=4)
 
             rename_btn = ctk.CTkButton(
-                row, text="แก้ชื่อ", width=70, fg_color="#2980b9", hover_color="#3498db",
+                frame, text="แก้ชื่อ", width=70, fg_color="#2980b9", hover_color="#3498db",
                 font=self._font(13),
                 command=lambda tid=track_id: self._rename_track(tid),
             )
             rename_btn.pack(side="right", padx=(4, 0), pady=4)
 
+            self._lib_rows.append({
+                "frame": frame, "title": title_label, "sub": sub_label,
+                "del_btn": del_btn, "rename_btn": rename_btn,
+                "id": track_id, "text": (title, sub),
+            })
+
     def _delete_track(self, track_id):
         tracks = load_tracks()
         track = next((t for t in tracks if t.get("id") == track_id), None)
@@ -1303,7 +1501,8 @@ class HookToShortApp(ctk.CTk):
         self.hook_slider.pack(side="left", padx=(0, 4))
         self.hook_length_label = ctk.CTkLabel(opts_frame, text="30 วิ.", width=46, font=self._font(13))
         self.hook_length_label.pack(side="left", padx=(0, 12))
-        self.hook_length_var.trace_add("write", lambda *_: self.hook_length_label.configure(text=f"{self.hook_length_var.get()} วิ."))
+        self._slider_after_id = None
+        self.hook_length_var.trace_add("write", self._on_hook_length_changed)
 
         # Hook preview button (inline with options row)
         self.preview_hook_btn = ctk.CTkButton(
@@ -1468,18 +1667,26 @@ class HookToShortApp(ctk.CTk):
         self._last_video_path = None
         self._refresh_track_dropdown()
 
+    def _on_hook_length_changed(self, *_):
+        """Debounced — a slider drag relabels once, 30 ms after the last step."""
+        if self._slider_after_id:
+            self.after_cancel(self._slider_after_id)
+        self._slider_after_id = self.after(30, self._apply_hook_length_label)
+
+    def _apply_hook_length_label(self):
+        self._slider_after_id = None
+        self.hook_length_label.configure(text=f"{self.hook_length_var.get()} วิ.")
+
     def _platform_key(self) -> str:
-        mapping = {"TikTok": "tiktok", "Reels": "reels", "YouTube Shorts": "youtube-short"}
-        return mapping.get(self.platform_var.get(), "tiktok")
+        return _PLATFORM_KEYS.get(self.platform_var.get(), "tiktok")
 
     def _refresh_track_dropdown(self):
         tracks = load_tracks()
         values = [f"{t['id']}: {t['title']}" for t in tracks]
         self.track_dropdown.configure(values=values if values else ["(ยังไม่มีเพลง)"])
-        if values:
-            self.track_var.set(values[0])
-        else:
-            self.track_var.set("(ยังไม่มีเพลง)")
+        first = values[0] if values else "(ยังไม่มีเพลง)"
+        if self.track_var.get() != first:  # avoid a redundant combobox redraw
+            self.track_var.set(first)
 
     def _selected_track(self) -> Optional[dict]:
         val = self.track_var.get()
@@ -1495,10 +1702,10 @@ class HookToShortApp(ctk.CTk):
     def _show_image_preview(self, image_path: str):
         """Show album art preview in the GUI."""
         try:
-            pil_img = PILImage.open(image_path)
+            mtime = os.path.getmtime(image_path)
+            pil_img = _preview_thumb(image_path, mtime, 200)
             # Scale to fit — max 200px height
-            ratio = 200 / pil_img.height
-            new_w = int(pil_img.width * ratio)
+            new_w = int(pil_img.width * 200 / pil_img.height)
             ctk_img = ctk.CTkImage(light_image=pil_img, dark_image=pil_img, size=(new_w, 200))
             self.preview_label.configure(image=ctk_img, text="")
             self.preview_label._ctk_image = ctk_img  # prevent GC
@@ -1538,7 +1745,7 @@ class HookToShortApp(ctk.CTk):
                 from python.main import extract_hook as _extract_hook
 
                 filename = Path(audio_path).stem
-                metadata = extract_metadata_from_title(filename)
+                metadata = _parse_title(filename)
                 song_title = metadata["song"]
 
                 # Build hook path — include manual start in name if provided
@@ -1695,16 +1902,15 @@ class HookToShortApp(ctk.CTk):
         def task():
             try:
                 filename = Path(track["file_path"]).stem
-                metadata = extract_metadata_from_title(filename)
+                metadata = _parse_title(filename)
                 song_title = metadata["song"]
                 artist = track.get("artist", "") or metadata["artist"]
                 if artist == "ไม่ทราบ":
                     artist = metadata["artist"]
 
-                detector = MoodDetector()
-                mood_info = detector.detect_from_artist_title(artist, song_title)
+                mood_info = _detect_mood(artist, song_title)
 
-                gen = KieAIGenerator()
+                gen = _get_kie_generator()
                 prompt = gen._build_prompt(
                     song_title, mood_info["mood"], mood_info["intensity"],
                     video_style, font_style, font_angle, artist,
@@ -1750,49 +1956,52 @@ class HookToShortApp(ctk.CTk):
                 # Step 1: Metadata — use artist from track data (YouTube channel)
                 self._gen_step("ขั้น 1/6  ดึงข้อมูลเพลง...")
                 filename = Path(audio_path).stem
-                metadata = extract_metadata_from_title(filename)
+                metadata = _parse_title(filename)
                 song_title = metadata["song"]
                 # Prefer artist from track (YouTube channel) over filename parse
                 artist = track.get("artist", "") or metadata["artist"]
                 if artist == "ไม่ทราบ":
                     artist = metadata["artist"]
 
+                # Hook lookup first — an existing hook plus a stored mood means
+                # steps 2–3 are just cache reads
+                use_preview = bool(self._preview_hook_path
+                                   and os.path.exists(self._preview_hook_path)
+                                   and str(hook_length) in os.path.basename(self._preview_hook_path))
+                if use_preview:
+                    hook_path = self._preview_hook_path
+                else:
+                    hook_filename = f"{song_title.replace(' ', '_')}_hook_{hook_length}s.wav"
+                    hook_path = os.path.join(OUTPUTS_FOLDER, hook_filename)
+                hook_cached = use_preview or os.path.exists(hook_path)
+
                 # Step 2: Mood detection
                 self._gen_step(f"ขั้น 2/6  ตรวจอารมณ์เพลง '{song_title}'...")
-                detector = MoodDetector()
-                mood_info = detector.detect_from_artist_title(artist, song_title)
+                mood_info = _detect_mood(artist, song_title)
                 mood = mood_info["mood"]
                 intensity = mood_info["intensity"]
 
                 # Step 3: Hook extraction
-                # Reuse hook from preview if available and matching length
-                if (self._preview_hook_path
-                        and os.path.exists(self._preview_hook_path)
-                        and str(hook_length) in os.path.basename(self._preview_hook_path)):
-                    hook_path = self._preview_hook_path
+                if use_preview:
                     self._gen_step("ขั้น 3/6  ใช้ท่อนฮุกจาก preview...")
                     logger.info(f"Using previewed hook: {hook_path}")
+                elif hook_cached:
+                    self._gen_step("ขั้น 3/6  ใช้ท่อนฮุกจาก cache...")
+                    logger.info(f"Hook cache hit: {hook_path}")
                 else:
-                    # Check cache — include length in filename
-                    hook_filename = f"{song_title.replace(' ', '_')}_hook_{hook_length}s.wav"
-                    hook_path = os.path.join(OUTPUTS_FOLDER, hook_filename)
-
-                    if os.path.exists(hook_path):
-                        self._gen_step("ขั้น 3/6  ใช้ท่อนฮุกจาก cache...")
-                        logger.info(f"Hook cache hit: {hook_path}")
-                    else:
-                        self._gen_step("ขั้น 3/6  ตัดท่อนฮุก (อาจใช้เวลาสักครู่)...")
-                        tmp_hook = os.path.join(OUTPUTS_FOLDER, f"_tmp_hook_{int(datetime.now().timestamp())}.wav")
-                        from python.main import extract_hook as _extract_hook
-                        if not _extract_hook(audio_path, tmp_hook, hook_length):
-                            if os.path.exists(tmp_hook):
-                                os.remove(tmp_hook)
-                            self.after(0, lambda: self._gen_done(None, "ตัดท่อนฮุกไม่สำเร็จ — อาจไม่พบท่อน chorus"))
-                            return
-                        # Rename temp to final path
-                        os.replace(tmp_hook, hook_path)
+                    self._gen_step("ขั้น 3/6  ตัดท่อนฮุก (อาจใช้เวลาสักครู่)...")
+                    tmp_hook = os.path.join(OUTPUTS_FOLDER, f"_tmp_hook_{int(datetime.now().timestamp())}.wav")
+                    from python.main import extract_hook as _extract_hook
+                    if not _extract_hook(audio_path, tmp_hook, hook_length):
+                        if os.path.exists(tmp_hook):
+                            os.remove(tmp_hook)
+                        self.after(0, lambda: self._gen_done(None, "ตัดท่อนฮุกไม่สำเร็จ — อาจไม่พบท่อน chorus"))
+                        return
+                    # Rename temp to final path
+                    os.replace(tmp_hook, hook_path)
 
-                # Step 4: Album art
+                # Step 4: Album art — only once the hook exists, so a failed
+                # extraction never spends image credits
                 art_filename = f"{song_title.replace(' ', '_')}_art.png"
                 art_path = os.path.join(OUTPUTS_FOLDER, art_filename)
                 image_path = None
@@ -1800,7 +2009,7 @@ class HookToShortApp(ctk.CTk):
 
                 if not gemini_only:
                     self._gen_step("ขั้น 4/6  สร้างภาพปกด้วย AI (Kie.ai)...")
-                    gen = KieAIGenerator()
+                    gen = _get_kie_generator()
                     image_path = gen.generate_album_art(
                         song_title=song_title,
                         mood=mood,
@@ -1873,8 +2082,11 @@ class HookToShortApp(ctk.CTk):
         threading.Thread(target=task, daemon=True).start()
 
     def _gen_step(self, text: str):
-        self.after(0, lambda: self.gen_progress.configure(text=text))
-        self.after(0, lambda: self.status_var.set(text))
+        self.after(0, self._apply_gen_step, text)
+
+    def _apply_gen_step(self, text: str):
+        self.gen_progress.configure(text=text)
+        self.status_var.set(text)
 
     def _gen_done(self, result: Optional[dict], error: Optional[str]):
         self.generate_btn.configure(state="normal")
@@ -1935,7 +2147,7 @@ class HookToShortApp(ctk.CTk):
             return
 
         tags_raw = self.upload_tags_var.get().strip()
-        tags = [t.strip().replace("#", "") for t in tags_raw.split(",") if t.strip()]
+        tags = tuple(t.strip().replace("#", "") for t in tags_raw.split(",") if t.strip())
         publish_mode = self.upload_privacy_var.get()
         promo_link = self.upload_promo_link_var.get().strip()
         auto_desc = promo_link if promo_link else ""
@@ -1960,7 +2172,7 @@ class HookToShortApp(ctk.CTk):
 
             self.after(0, done)
 
-        threading.Thread(target=task, daemon=True).start()
+        self._upload_queue.put((task, ()))
 
     def _open_video(self):
         if self._last_video_path and os.path.exists(self._last_video_path):
@@ -2114,15 +2326,14 @@ class HookToShortApp(ctk.CTk):
                     try:
                         # Metadata
                         filename = Path(audio_path).stem
-                        metadata = extract_metadata_from_title(filename)
+                        metadata = _parse_title(filename)
                         song_title = metadata["song"]
                         artist = track.get("artist", "") or metadata["artist"]
                         if artist == "ไม่ทราบ":
                             artist = metadata["artist"]
 
                         # Mood
-                        detector = MoodDetector()
-                        mood_info = detector.detect_from_artist_title(artist, song_title)
+                        mood_info = _detect_mood(artist, song_title)
                         mood = mood_info["mood"]
                         intensity = mood_info["intensity"]
 
@@ -2145,7 +2356,7 @@ class HookToShortApp(ctk.CTk):
                         image_path = None
 
                         if not gemini_only:
-                            gen = KieAIGenerator()
+                            gen = _get_kie_generator()
                             image_path = gen.generate_album_art(
                                 song_title=song_title, mood=mood, intensity=intensity,
                                 output_path=art_path, video_style=video_style,
@@ -2401,6 +2612,7 @@ class HookToShortApp(ctk.CTk):
         self.upload_result_frame.pack(fill="x", padx=8, pady=4)
         self._upload_result_rows_frame = ctk.CTkFrame(self.upload_result_frame, fg_color="transparent")
         self._upload_result_rows_frame.pack(fill="x", padx=8, pady=(6, 2))
+        self._last_result_keys: list[tuple] = []  # (platform, status, url/error) of shown rows
         self.upload_retry_btn = ctk.CTkButton(
             self.upload_result_frame, text="ลองอีกครั้ง", width=100, font=self._font(12),
             command=self._on_upload)
@@ -2417,10 +2629,10 @@ class HookToShortApp(ctk.CTk):
                                                   state="disabled", wrap="word")
         self.upload_history_box.pack(fill="both", expand=True, padx=8, pady=(0, 8))
 
-        # Initialize
+        # Initialize — video list builds widgets now; status + history load off the Tk thread
+        # once the event loop is running (worker hands results back via self.after)
         self._refresh_upload_videos()
-        self._update_platform_status()
-        self._refresh_upload_history()
+        self.after_idle(lambda: threading.Thread(target=self._init_upload_tab_async, daemon=True).start())
 
     def _refresh_upload_videos(self):
         videos = get_output_videos(OUTPUTS_FOLDER)
@@ -2438,15 +2650,23 @@ class HookToShortApp(ctk.CTk):
             self.upload_video_var.set("")
             return
 
-        for vid in videos:
-            var = ctk.BooleanVar(value=False)
-            row = ctk.CTkFrame(self._upload_video_list_frame, fg_color="transparent")
-            row.pack(fill="x", pady=1)
-            date_str = vid.get('date', '')
-            ctk.CTkCheckBox(row, text=f"{vid['filename']}  ({vid['size_mb']} MB)  {date_str}",
-                            variable=var, font=self._font(11),
-                            command=self._on_video_check_changed).pack(side="left")
-            self._upload_video_checks.append((var, vid["filename"]))
+        # Freeze geometry propagation while rows are added so the list is laid out
+        # in one pass instead of once per row
+        frame = self._upload_video_list_frame
+        frame.pack_propagate(False)
+        try:
+            for vid in videos:
+                var = ctk.BooleanVar(value=False)
+                row = ctk.CTkFrame(frame, fg_color="transparent")
+                row.pack(fill="x", pady=1)
+                date_str = vid.get('date', '')
+                ctk.CTkCheckBox(row, text=f"{vid['filename']}  ({vid['size_mb']} MB)  {date_str}",
+                                variable=var, font=self._font(11),
+                                command=self._on_video_check_changed).pack(side="left")
+                self._upload_video_checks.append((var, vid["filename"]))
+        finally:
+            frame.pack_propagate(True)
+            frame.update_idletasks()
 
         # Select first by default
         if self._upload_video_checks:
@@ -2576,55 +2796,84 @@ class HookToShortApp(ctk.CTk):
             self.upload_title_var.set("")
 
     def _update_platform_status(self):
-        """Update configuration status labels for each platform."""
-        # YouTube
-        yt = YouTubeUploader()
-        if yt.is_configured():
-            self.yt_status_label.configure(text="พร้อม (client_secrets.json)", text_color="#2ecc71")
-            self.yt_manual_btn.pack_forget()
-        else:
-            self.yt_status_label.configure(text="ยังไม่ตั้งค่า", text_color="#e67e22")
-            self.yt_manual_btn.pack(side="left", padx=(4, 0))
+        """Update configuration status labels — config checks run off the Tk thread."""
+        def task():
+            status = self._read_platform_status()
+            self.after(0, lambda: self._apply_platform_status(status))
+
+        threading.Thread(target=task, daemon=True).start()
+
+    def _init_upload_tab_async(self):
+        """Background init for the upload tab: read settings + history, then apply on Tk thread."""
+        status = self._read_platform_status()
+        history = load_upload_history()
+
+        def apply():
+            self._apply_platform_status(status)
+            self._apply_upload_history(history)
+
+        self.after(0, apply)
+
+    @staticmethod
+    def _read_platform_status() -> dict:
+        """Check upload credentials for each platform (disk I/O — safe off the Tk thread).
 
-        # TikTok (Browser — cookie check)
+        Returns {platform: ready-label text, or None if not configured}.
+        """
         s = load_settings()
-        tt_browser = TikTokBrowserUploader()
-        if tt_browser.is_configured():
-            self.tt_status_label.configure(text="พร้อม (cookie)", text_color="#2ecc71")
-            self.tt_manual_btn.pack_forget()
-        else:
-            self.tt_status_label.configure(text="ยังไม่ได้ login", text_color="#e67e22")
-            self.tt_manual_btn.pack(side="left", padx=(4, 0))
+        fb_id = s.get("facebook_page_id", "")
+        fb_target = f"Page: {fb_id}" if fb_id else "โปรไฟล์ส่วนตัว"
+        return {
+            "youtube": "พร้อม (client_secrets.json)" if YouTubeUploader().is_configured() else None,
+            "tiktok": "พร้อม (cookie)" if TikTokBrowserUploader().is_configured() else None,
+            "facebook": f"พร้อม ({fb_target})" if s.get("facebook_access_token", "") else None,
+        }
 
-        # Facebook
-        fb_token = s.get("facebook_access_token", "")
-        if fb_token:
-            fb_id = s.get("facebook_page_id", "")
-            target = f"Page: {fb_id}" if fb_id else "โปรไฟล์ส่วนตัว"
-            self.fb_status_label.configure(text=f"พร้อม ({target})", text_color="#2ecc71")
-            self.fb_manual_btn.pack_forget()
-        else:
-            self.fb_status_label.configure(text="ยังไม่ตั้งค่า", text_color="#e67e22")
-            self.fb_manual_btn.pack(side="left", padx=(4, 0))
+    def _apply_platform_status(self, status: dict):
+        """Set the platform status labels from _read_platform_status() output."""
+        rows = (
+            ("youtube", self.yt_status_label, self.yt_manual_btn, "ยังไม่ตั้งค่า"),
+            ("tiktok", self.tt_status_label, self.tt_manual_btn, "ยังไม่ได้ login"),
+            ("facebook", self.fb_status_label, self.fb_manual_btn, "ยังไม่ตั้งค่า"),
+        )
+        for key, label, manual_btn, missing_text in rows:
+            ready_text = status[key]
+            if ready_text:
+                label.configure(text=ready_text, text_color="#2ecc71")
+                manual_btn.pack_forget()
+            else:
+                label.configure(text=missing_text, text_color="#e67e22")
+                manual_btn.pack(side="left", padx=(4, 0))
 
     def _refresh_upload_history(self):
-        history = load_upload_history()
+        """Reload upload history on a background thread, then redraw the history box."""
+        def task():
+            history = load_upload_history()
+            self.after(0, lambda: self._apply_upload_history(history))
+
+        threading.Thread(target=task, daemon=True).start()
+
+    def _apply_upload_history(self, history: list):
         self.upload_history_box.configure(state="normal")
         self.upload_history_box.delete("1.0", "end")
         if not history:
             self.upload_history_box.insert("1.0", "(ยังไม่มีประวัติอัปโหลด)")
         else:
-            # Show most recent first, max 20
+            # Show most recent first, max 20 — build text once, single insert
+            lines = []
             for entry in reversed(history[-20:]):
-                ts = entry.get("timestamp", "")[:16].replace("T", " ")
-                icon = "OK" if entry.get("status") == "success" else "FAIL"
-                url = entry.get("url", "")
-                line = f"[{ts}] [{icon}] {entry.get('platform', '?')} — {entry.get('video', '?')}"
+                g = entry.get
+                ts = g("timestamp", "")[:16].replace("T", " ")
+                icon = "OK" if g("status") == "success" else "FAIL"
+                url = g("url", "")
+                err = g("error")
+                line = f"[{ts}] [{icon}] {g('platform', '?')} — {g('video', '?')}"
                 if url:
                     line += f"  →  {url}"
-                elif entry.get("error"):
-                    line += f"  ({entry['error'][:60]})"
-                self.upload_history_box.insert("end", line + "\n")
+                elif err:
+                    line += f"  ({err[:60]})"
+                lines.append(line)
+            self.upload_history_box.insert("end", "\n".join(lines) + "\n")
         self.upload_history_box.configure(state="disabled")
 
     def _get_selected_video_filenames(self) -> list[str]:
@@ -2635,7 +2884,7 @@ class HookToShortApp(ctk.CTk):
         self.after(0, lambda p=progress: self.upload_progress_bar.set(p))
 
     def _upload_single(self, video_path: str, title: str, description: str,
-                       tags: list[str], publish_mode: str, platforms: list[str],
+                       tags: tuple[str, ...], publish_mode: str, platforms: list[str],
                        step_prefix: str = "",
                        batch_offset: int = 0) -> list[UploadResult]:
         """Upload one video to selected platforms. Called from background thread.
@@ -2691,23 +2940,21 @@ class HookToShortApp(ctk.CTk):
             self._upload_step(f"{step} {plat_name}: กำลังอัปโหลด...{schedule_note}")
 
             if platform == "youtube":
-                yt = YouTubeUploader()
-                result = upload_with_retry(
-                    lambda: yt.upload(req, progress_callback=self._upload_progress_callback))
+                uploader = YouTubeUploader()
             elif platform == "tiktok":
-                tt = TikTokBrowserUploader()
-                result = upload_with_retry(
-                    lambda: tt.upload(req, progress_callback=self._upload_progress_callback))
+                uploader = TikTokBrowserUploader()
             elif platform == "facebook":
                 s = load_settings()
-                fb = FacebookUploader(
+                uploader = FacebookUploader(
                     page_id=s.get("facebook_page_id", ""),
                     access_token=s.get("facebook_access_token", ""),
                 )
-                result = upload_with_retry(
-                    lambda: fb.upload(req, progress_callback=self._upload_progress_callback))
             else:
                 continue
+            # Backoff 1s → 2s → 4s (±50% jitter); auth/config errors are not retried
+            result = upload_with_retry(
+                lambda u=uploader, r=req: u.upload(r, progress_callback=self._upload_progress_callback),
+                max_retries=3, base_delay=1.0, max_delay=30.0, jitter=0.5)
             results.append(result)
         return results
 
@@ -2763,7 +3010,7 @@ class HookToShortApp(ctk.CTk):
         if promo_link:
             description = f"{description}\n{promo_link}" if description else promo_link
         tags_raw = self.upload_tags_var.get().strip()
-        tags = [t.strip().replace("#", "") for t in tags_raw.split(",") if t.strip()]
+        tags = tuple(t.strip().replace("#", "") for t in tags_raw.split(",") if t.strip())
         publish_mode = self.upload_privacy_var.get()
 
         # Validate custom schedule before starting upload
@@ -2783,34 +3030,48 @@ class HookToShortApp(ctk.CTk):
         self.upload_progress.configure(text="เริ่มอัปโหลด...")
         self.status_var.set("กำลังอัปโหลด...")
 
-        is_batch = len(selected_files) > 1
-
-        def task():
-            all_results = []
-            for vid_idx, fname in enumerate(selected_files):
-                video_path = os.path.join(OUTPUTS_FOLDER, fname)
-                # For batch: auto-generate title from filename; for single: use custom title
-                if is_batch:
-                    title = fname.replace("_short.mp4", "").replace("_", " ")
-                    prefix = f"[{vid_idx + 1}/{len(selected_files)}] "
-                    self._upload_step(f"{prefix}{fname}")
-                else:
-                    title = custom_title or fname.replace("_short.mp4", "").replace("_", " ")
-                    prefix = ""
+        self._upload_queue.put((self._run_upload_job, (
+            selected_files, platforms, custom_title, description, tags, publish_mode)))
 
-                # Batch: auto-space schedule (+1 day per video)
-                batch_offset = vid_idx if is_batch else 0
+    def _upload_worker_loop(self):
+        """Persistent upload worker — runs queued (fn, args) jobs one at a time."""
+        while True:
+            fn, args = self._upload_queue.get()
+            try:
+                fn(*args)
+            except Exception as e:
+                logger.error(f"Upload worker error: {e}")
+            finally:
+                self._upload_queue.task_done()
+
+    def _run_upload_job(self, selected_files: list[str], platforms: list[str],
+                        custom_title: str, description: str, tags: tuple[str, ...],
+                        publish_mode: str):
+        """Upload selected videos to selected platforms. Runs on the upload worker."""
+        is_batch = len(selected_files) > 1
+        all_results = []
+        for vid_idx, fname in enumerate(selected_files):
+            video_path = os.path.join(OUTPUTS_FOLDER, fname)
+            # For batch: auto-generate title from filename; for single: use custom title
+            if is_batch:
+                title = _filename_to_title(fname)
+                prefix = f"[{vid_idx + 1}/{len(selected_files)}] "
+                self._upload_step(f"{prefix}{fname}")
+            else:
+                title = custom_title or _filename_to_title(fname)
+                prefix = ""
 
-                results = self._upload_single(video_path, title, description,
-                                              tags, publish_mode, platforms, prefix,
-                                              batch_offset=batch_offset)
-                # Save history per video
-                self.after(0, lambda f=fname, r=list(results): add_upload_record(f, r))
-                all_results.extend(results)
+            # Batch: auto-space schedule (+1 day per video)
+            batch_offset = vid_idx if is_batch else 0
 
-            self.after(0, lambda r=all_results: self._upload_done_batch(r, len(selected_files)))
+            results = self._upload_single(video_path, title, description,
+                                          tags, publish_mode, platforms, prefix,
+                                          batch_offset=batch_offset)
+            # Save history per video
+            self.after(0, lambda f=fname, r=list(results): add_upload_record(f, r))
+            all_results.extend(results)
 
-        threading.Thread(target=task, daemon=True).start()
+        self.after(0, lambda r=all_results: self._upload_done_batch(r, len(selected_files)))
 
     def _upload_step(self, text: str):
         self.after(0, lambda: self.upload_progress.configure(text=text))
@@ -2821,30 +3082,13 @@ class HookToShortApp(ctk.CTk):
         self.upload_progress_bar.set(1.0)
         self.upload_progress_bar.pack_forget()
 
-        # Clear previous result rows
-        for w in self._upload_result_rows_frame.winfo_children():
-            w.destroy()
+        success_count = sum(1 for r in results if r.status == UploadStatus.SUCCESS)
 
-        success_count = 0
-        for r in results:
-            row = ctk.CTkFrame(self._upload_result_rows_frame, fg_color="transparent")
-            row.pack(fill="x", pady=1)
-
-            if r.status == UploadStatus.SUCCESS:
-                success_count += 1
-                ctk.CTkLabel(row, text=f"[OK] {r.platform}", font=self._font(12),
-                             text_color="#2ecc71", anchor="w").pack(side="left")
-                if r.url:
-                    url = r.url
-                    link_btn = ctk.CTkButton(
-                        row, text=url, width=0, height=22, font=self._font(11),
-                        fg_color="transparent", text_color="#3498db",
-                        hover_color=("gray85", "gray30"), anchor="w",
-                        command=lambda u=url: webbrowser.open(u))
-                    link_btn.pack(side="left", padx=(8, 0))
-            else:
-                ctk.CTkLabel(row, text=f"[FAIL] {r.platform}  —  {r.error or 'unknown error'}",
-                             font=self._font(12), text_color="#e74c3c", anchor="w").pack(side="left")
+        # Rebuild result rows only when the result set changed (e.g. not on an identical retry)
+        new_keys = [(r.platform, r.status, r.url or r.error) for r in results]
+        if new_keys != self._last_result_keys:
+            self._build_upload_result_rows(results)
+            self._last_result_keys = new_keys
 
         self._refresh_upload_history()
 
@@ -2863,6 +3107,29 @@ class HookToShortApp(ctk.CTk):
 
         self.status_var.set(f"อัปโหลดเสร็จ — {success_count}/{total}")
 
+    def _build_upload_result_rows(self, results: list[UploadResult]):
+        """Replace the per-platform result rows under the upload button."""
+        for w in self._upload_result_rows_frame.winfo_children():
+            w.destroy()
+
+        for r in results:
+            row = ctk.CTkFrame(self._upload_result_rows_frame, fg_color="transparent")
+            row.pack(fill="x", pady=1)
+
+            prefix, color = _STATUS_STYLE[r.status]
+            ok = r.status == UploadStatus.SUCCESS
+            text = f"{prefix} {r.platform}" if ok else f"{prefix} {r.platform}  —  {r.error or 'unknown error'}"
+            ctk.CTkLabel(row, text=text, font=self._font(12),
+                         text_color=color, anchor="w").pack(side="left")
+            if ok and r.url:
+                url = r.url
+                link_btn = ctk.CTkButton(
+                    row, text=url, width=0, height=22, font=self._font(11),
+                    fg_color="transparent", text_color="#3498db",
+                    hover_color=("gray85", "gray30"), anchor="w",
+                    command=lambda u=url: webbrowser.open(u))
+                link_btn.pack(side="left", padx=(8, 0))
+
     # -----------------------------------------------------------------------
     # Upload Templates
     # -----------------------------------------------------------------------
@@ -3635,9 +3902,9 @@ class HookToShortApp(ctk.CTk):
         if os.path.exists(_env_path):
             with open(_env_path, "r", encoding="utf-8") as f:
                 for raw_line in f:
-                    stripped = raw_line.strip()
-                    if stripped and not stripped.startswith("#") and "=" in stripped:
-                        key = stripped.split("=", 1)[0].strip()
+                    key, sep, _ = raw_line.partition("=")
+                    key = key.strip()
+                    if sep and key and key[:1] != "#":
                         if key in updates:
                             lines.append(f"{key}={updates[key]}\n")
                             found_keys.add(key)
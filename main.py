@@ -2,8 +2,6 @@ import os
 import sys
 import logging
 import argparse
-from pychorus import find_and_output_chorus
-from pydub import AudioSegment
 from video_utils import create_short_video
 
 # Configure logging
@@ -13,15 +11,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SUPPORTED_FORMATS = ('.mp3', '.wav', '.flac', '.ogg', '.m4a')
+_SUPPORTED_EXTS = frozenset(SUPPORTED_FORMATS)
+
 def validate_input_file(file_path):
     """Validate that the input file exists and is of supported format."""
     if not os.path.exists(file_path):
         logger.error(f"Input file '{file_path}' does not exist.")
         return False
     
-    supported_formats = ('.mp3', '.wav', '.flac', '.ogg', '.m4a')
-    if not file_path.lower().endswith(supported_formats):
-        logger.error(f"Unsupported format. Supported: {supported_formats}")
+    if os.path.splitext(file_path)[1].lower() not in _SUPPORTED_EXTS:
+        logger.error(f"Unsupported format. Supported: {SUPPORTED_FORMATS}")
         return False
     
     return True
@@ -44,6 +44,8 @@ def extract_hook(input_file, output_file, clip_length=30):
         return False
     
     try:
+        # Imported here so --help and bad paths don't pay for librosa/numba startup
+        from pychorus import find_and_output_chorus
         chorus_start = find_and_output_chorus(input_file, output_file, clip_length)
         
         if chorus_start is not None:
@@ -6,13 +6,14 @@ Complete workflow for YouTube → Hook → Album Art → Short Video
 __version__ = "1.0.0"
 __author__ = "Hook-to-Short Team"
 
-from .mood_detector import MoodDetector, extract_metadata_from_title
+from .mood_detector import MoodDetector, detect_mood, extract_metadata_from_title
 from .kie_generator import KieAIGenerator
 from .video_composer import VideoComposer, compose_complete_short
 from .workflow import FulWorkflowOrchestrator
 
 __all__ = [
     'MoodDetector',
+    'detect_mood',
     'extract_metadata_from_title',
     'KieAIGenerator',
     'VideoComposer',
@@ -0,0 +1,87 @@
+"""
+Numba-jitted chorus search — same result as pychorus.helpers.find_chorus
+
+pychorus builds both similarity matrices by broadcasting a 12 x n x n
+difference tensor, which costs O(12·n²) memory and time on every call.
+Here the time-time matrix is one parallel loop (symmetric, half the work)
+and the time-lag matrix is a gather from it. Denoising, line detection
+and scoring are still pychorus's own code.
+
+Requires numba — importing this module raises ImportError without it,
+so callers fall back to pychorus.helpers.find_chorus.
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+from pychorus.helpers import (
+    TimeTimeSimilarityMatrix, TimeLagSimilarityMatrix,
+    local_maxima_rows, detect_lines, count_overlapping_lines, best_segment,
+    SMOOTHING_SIZE_SEC, OVERLAP_PERCENT_MARGIN,
+)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _time_time_similarity(chroma):
+    """1 - ||c_i - c_j|| / sqrt(12) for every pair of chroma frames"""
+    bins, n = chroma.shape
+    norm = math.sqrt(12)
+    out = np.empty((n, n))
+    for i in prange(n):
+        for j in range(i + 1):
+            d = 0.0
+            for k in range(bins):
+                diff = chroma[k, i] - chroma[k, j]
+                d += diff * diff
+            s = 1.0 - math.sqrt(d) / norm
+            out[i, j] = s
+            out[j, i] = s
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _time_lag_from_time_time(tt):
+    """Row = lag, column = time — pychorus's rotated circulant layout"""
+    n = tt.shape[0]
+    out = np.empty((n, n))
+    for lag in prange(n):
+        for t in range(n):
+            out[lag, t] = tt[t, (t - lag + n) % n]
+    return out
+
+
+class _TimeTime(TimeTimeSimilarityMatrix):
+    def compute_similarity_matrix(self, chroma):
+        return _time_time_similarity(np.ascontiguousarray(chroma))
+
+
+class _TimeLag(TimeLagSimilarityMatrix):
+    def __init__(self, time_time, sample_rate):
+        # Built from the time-time matrix, not chroma — skip the base __init__
+        self.chroma = time_time.chroma
+        self.sample_rate = sample_rate
+        self.matrix = _time_lag_from_time_time(time_time.matrix)
+
+
+def find_chorus(chroma, sr, song_length_sec, clip_length):
+    """Drop-in for pychorus.helpers.find_chorus — start time in seconds, or None"""
+    num_samples = chroma.shape[1]
+
+    time_time_similarity = _TimeTime(chroma, sr)
+    time_lag_similarity = _TimeLag(time_time_similarity, sr)
+
+    chroma_sr = num_samples / song_length_sec
+    smoothing_size_samples = int(SMOOTHING_SIZE_SEC * chroma_sr)
+    time_lag_similarity.denoise(time_time_similarity.matrix, smoothing_size_samples)
+
+    clip_length_samples = clip_length * chroma_sr
+    candidate_rows = local_maxima_rows(time_lag_similarity.matrix)
+    lines = detect_lines(time_lag_similarity.matrix, candidate_rows, clip_length_samples)
+    if len(lines) == 0:
+        return None
+
+    line_scores = count_overlapping_lines(
+        lines, OVERLAP_PERCENT_MARGIN * clip_length_samples, clip_length_samples)
+    best_chorus = best_segment(line_scores)
+    return best_chorus.start / chroma_sr
@@ -0,0 +1,68 @@
+"""
+Font style prompts + album-art prompt template
+Shared by KieAIGenerator and GeminiImageGenerator (same model — Nano Banana Pro)
+"""
+
+import functools
+from types import MappingProxyType
+from typing import Mapping
+
+DEFAULT_FONT_STYLE = "ลายมือพู่กัน"
+
+# Font style (UI label) → typography prompt fragment
+FONT_STYLES: Mapping[str, str] = MappingProxyType({
+    "ลายมือพู่กัน": "Thai handwritten brush calligraphy, smooth flowing strokes, natural thick-thin variation, soft emotional mood, warm romantic and nostalgic feeling, handwritten title style",
+    "โปสเตอร์หนังไทย": "Thai classic movie poster typography, bold Thai display font, vivid red color, sharp clean edges, vintage Thai cinema style, high readability retro poster look",
+    "โค้งมน ชิลคาเฟ่": "Thai rounded handwritten display font, soft curved letterforms, thick and easy-to-read strokes, chill playlist style, cozy cafe mood, friendly and casual typography",
+    "ชอล์กอินดี้": "Thai handwritten chalk brush typography, rough broken brush strokes, chalk-like texture, raw handmade lettering, indie aesthetic, lonely and emotional mood",
+    "ชอล์กกระดานดำ": "Thai chalk handwritten typography, rough grainy strokes, powdery broken edges, blackboard writing style, quiet and contemplative mood, deep and thoughtful feeling",
+    "ลายมืออินดี้": "Thai indie handwritten typography, natural imperfect strokes, casual hand-drawn lettering, folk music aesthetic, lonely yet warm mood, authentic handwritten feel",
+    "พู่กันสะบัดแรง": "Thai expressive brush calligraphy, fast energetic brush strokes, strong flicks and dynamic movement, clear thick-thin contrast, emotional and powerful handwriting",
+    "พู่กันโรแมนติก": "Thai romantic brush calligraphy, smooth continuous strokes, beautiful thick-thin variation, well-controlled rhythm, warm and romantic mood, elegant handwritten lettering",
+    "พู่กันธรรมชาติ": "Thai organic brush calligraphy, slightly broken natural strokes, visible hand rhythm, uneven thick-thin variation, calm deep and sincere mood, honest handcrafted lettering",
+    "คลาสสิก มีเชิง": "Thai classical serif display typography, elegant traditional letterforms, sharp clean strokes, balanced proportions, refined and warm aesthetic",
+    "โค้งมน นุ่มนวล": "Thai soft decorative handwritten typography, rounded smooth letterforms, gentle strokes with moderate thick-thin balance, warm and romantic feeling, friendly and elegant style",
+    "พู่กันเส้นยาว": "Thai handwritten brush calligraphy, long continuous strokes, natural pressure-based thick-thin variation, rounded stroke endings with trailing tails, raw emotional mood, lonely and realistic handwritten style",
+    "Cursive โรแมนติก": "Thai handwritten calligraphy typography, soft brush pen strokes, flowing cursive Thai letters, natural uneven strokes, romantic and nostalgic mood, handwritten title style, gentle curves, emotional handwriting",
+    "Bold Grunge": "Thai bold sans-serif typography, rough grainy texture, powdery edges, chalk-like broken strokes, slightly blurred distressed text, grunge Thai typography style, raw emotional text",
+    "Modern Brush": "Thai modern handwritten brush typography, bold expressive strokes, clear thick-thin contrast, casual and friendly style",
+})
+
+_TILTED_ANGLE = "เฉียงขึ้น"
+_TILTED_SUFFIX = ", tilted upward angle, dynamic slanted text"
+
+# (font style, tilted?) → final font prompt, built once at import
+_FONT_PROMPT_TABLE: Mapping[tuple, str] = MappingProxyType({
+    (style, tilted): prompt + (_TILTED_SUFFIX if tilted else "")
+    for style, prompt in FONT_STYLES.items()
+    for tilted in (False, True)
+})
+
+# Prompt structure:
+# [images concept & caption & title & mood: {Song} by {Artist}]
+# [subject: visual representation]
+# [{video_style} music video style]
+# [font style + angle from user selection]
+_PROMPT_TEMPLATE = (
+    "[images concept & caption & title & mood: {title_part}]"
+    "[subject: คนที่สื่อความหมายถึงอารมณ์เพลง]"
+    "[{video_style} Music video style]"
+    "[{font_prompt}]"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def build_prompt(song_title: str, video_style: str = 'Thai', font_style: str = DEFAULT_FONT_STYLE,
+                 font_angle: str = 'เฉียงขึ้น', artist: str = '') -> str:
+    """Build the album-art prompt for Nano Banana Pro (pure — memoized per argument tuple)"""
+    if font_style not in FONT_STYLES:
+        font_style = DEFAULT_FONT_STYLE
+    font_prompt = _FONT_PROMPT_TABLE[font_style, font_angle == _TILTED_ANGLE]
+
+    title_part = f"{song_title} by {artist}" if artist else song_title
+
+    return _PROMPT_TEMPLATE.format_map({
+        "title_part": title_part,
+        "video_style": video_style,
+        "font_prompt": font_prompt,
+    })
@@ -5,14 +5,20 @@ Only Gemini 3 Pro can render text in images.
 """
 
 import os
-import base64
+import binascii
 import logging
-import requests
 from pathlib import Path
 from typing import Optional
 
+from .http_session import make_session, json_loads
+from .font_styles import FONT_STYLES, build_prompt
+
 logger = logging.getLogger(__name__)
 
+_SESSION = make_session()
+
+_B64_CHUNK = 65536 // 3 * 4  # base64 chars that decode to ~64 KB
+
 
 class GeminiImageGenerator:
     """Generate images using Google Gemini 3 Pro Image API (Nano Banana Pro)"""
@@ -24,24 +30,7 @@ class GeminiImageGenerator:
         if not self.api_key:
             logger.error("Gemini API key not configured — set GEMINI_API_KEY in .env")
 
-    # Same font style map as KieAIGenerator — same model (Nano Banana Pro)
-    FONT_STYLES = {
-        "ลายมือพู่กัน": "Thai handwritten brush calligraphy, smooth flowing strokes, natural thick-thin variation, soft emotional mood, warm romantic and nostalgic feeling, handwritten title style",
-        "โปสเตอร์หนังไทย": "Thai classic movie poster typography, bold Thai display font, vivid red color, sharp clean edges, vintage Thai cinema style, high readability retro poster look",
-        "โค้งมน ชิลคาเฟ่": "Thai rounded handwritten display font, soft curved letterforms, thick and easy-to-read strokes, chill playlist style, cozy cafe mood, friendly and casual typography",
-        "ชอล์กอินดี้": "Thai handwritten chalk brush typography, rough broken brush strokes, chalk-like texture, raw handmade lettering, indie aesthetic, lonely and emotional mood",
-        "ชอล์กกระดานดำ": "Thai chalk handwritten typography, rough grainy strokes, powdery broken edges, blackboard writing style, quiet and contemplative mood, deep and thoughtful feeling",
-        "ลายมืออินดี้": "Thai indie handwritten typography, natural imperfect strokes, casual hand-drawn lettering, folk music aesthetic, lonely yet warm mood, authentic handwritten feel",
-        "พู่กันสะบัดแรง": "Thai expressive brush calligraphy, fast energetic brush strokes, strong flicks and dynamic movement, clear thick-thin contrast, emotional and powerful handwriting",
-        "พู่กันโรแมนติก": "Thai romantic brush calligraphy, smooth continuous strokes, beautiful thick-thin variation, well-controlled rhythm, warm and romantic mood, elegant handwritten lettering",
-        "พู่กันธรรมชาติ": "Thai organic brush calligraphy, slightly broken natural strokes, visible hand rhythm, uneven thick-thin variation, calm deep and sincere mood, honest handcrafted lettering",
-        "คลาสสิก มีเชิง": "Thai classical serif display typography, elegant traditional letterforms, sharp clean strokes, balanced proportions, refined and warm aesthetic",
-        "โค้งมน นุ่มนวล": "Thai soft decorative handwritten typography, rounded smooth letterforms, gentle strokes with moderate thick-thin balance, warm and romantic feeling, friendly and elegant style",
-        "พู่กันเส้นยาว": "Thai handwritten brush calligraphy, long continuous strokes, natural pressure-based thick-thin variation, rounded stroke endings with trailing tails, raw emotional mood, lonely and realistic handwritten style",
-        "Cursive โรแมนติก": "Thai handwritten calligraphy typography, soft brush pen strokes, flowing cursive Thai letters, natural uneven strokes, romantic and nostalgic mood, handwritten title style, gentle curves, emotional handwriting",
-        "Bold Grunge": "Thai bold sans-serif typography, rough grainy texture, powdery edges, chalk-like broken strokes, slightly blurred distressed text, grunge Thai typography style, raw emotional text",
-        "Modern Brush": "Thai modern handwritten brush typography, bold expressive strokes, clear thick-thin contrast, casual and friendly style",
-    }
+    FONT_STYLES = FONT_STYLES  # shared table — see python/font_styles.py
 
     def generate_album_art(
         self,
@@ -90,7 +79,7 @@ class GeminiImageGenerator:
             url = f"{self.API_URL}?key={self.api_key}"
 
             logger.info("[Gemini] Sending request...")
-            response = requests.post(
+            response = _SESSION.post(
                 url,
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -101,7 +90,7 @@ class GeminiImageGenerator:
                 logger.error(f"[Gemini] API Error {response.status_code}: {response.text[:500]}")
                 return None
 
-            result = response.json()
+            result = json_loads(response.content)
             return self._extract_and_save_image(result, output_path, song_title)
 
         except Exception as e:
@@ -110,21 +99,7 @@ class GeminiImageGenerator:
 
     def _build_prompt(self, song_title: str, mood: str, intensity: str, video_style: str = 'Thai', font_style: str = 'ลายมือพู่กัน', font_angle: str = 'เฉียงขึ้น', artist: str = '') -> str:
         """Build prompt for Nano Banana Pro — same format as KieAIGenerator"""
-        font_prompt = self.FONT_STYLES.get(font_style, self.FONT_STYLES["ลายมือพู่กัน"])
-
-        if font_angle == "เฉียงขึ้น":
-            font_prompt += ", tilted upward angle, dynamic slanted text"
-
-        title_part = f"{song_title} by {artist}" if artist else song_title
-
-        prompt = (
-            f"[images concept & caption & title & mood: {title_part}]"
-            f"[subject: คนที่สื่อความหมายถึงอารมณ์เพลง]"
-            f"[{video_style} Music video style]"
-            f"[{font_prompt}]"
-        )
-
-        return prompt
+        return build_prompt(song_title, video_style, font_style, font_angle, artist)
 
     def _extract_and_save_image(self, result: dict, output_path: Optional[str], song_title: str) -> Optional[str]:
         """Extract base64 image from Gemini response and save as PNG"""
@@ -139,7 +114,7 @@ class GeminiImageGenerator:
             for part in parts:
                 inline_data = part.get("inlineData")
                 if inline_data and inline_data.get("data"):
-                    image_bytes = base64.b64decode(inline_data["data"])
+                    b64 = inline_data["data"]
 
                     if not output_path:
                         output_path = f"generated_{song_title.replace(' ', '_')}.png"
@@ -147,8 +122,11 @@ class GeminiImageGenerator:
                     output_file = Path(output_path)
                     output_file.parent.mkdir(parents=True, exist_ok=True)
 
+                    # Decode in 64 KB-output chunks instead of one multi-MB bytes object
+                    # (chunk length is a multiple of 4 so every slice is valid base64)
                     with open(output_path, 'wb') as f:
-                        f.write(image_bytes)
+                        for i in range(0, len(b64), _B64_CHUNK):
+                            f.write(binascii.a2b_base64(b64[i:i + _B64_CHUNK]))
 
                     logger.info(f"[Gemini] Image saved: {output_path}")
                     return output_path
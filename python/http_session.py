@@ -0,0 +1,35 @@
+"""
+Shared HTTP sessions — keep-alive connection pools + retry on gateway errors
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional: orjson parses response bytes directly, no bytes→str decode first
+# (orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers still match)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+def make_session(pool_maxsize: int = 32, retries: int = 3) -> requests.Session:
+    """
+    Create a Session that reuses TCP/TLS connections across calls.
+
+    Only idempotent methods (GET/HEAD/...) are retried on 502/503/504 —
+    urllib3 never retries POST by default, so task creation and uploads
+    are not sent twice.
+    No auth headers are set here: callers pass their own per request.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=retries, backoff_factor=0.5,
+                          status_forcelist=[502, 503, 504], raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -4,16 +4,22 @@ Generates album art/background images for short videos
 """
 
 import os
-import requests
 import logging
 import time
-import math
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Dict
 import json
 
+from .http_session import make_session, json_loads
+from .font_styles import FONT_STYLES, build_prompt
+
 logger = logging.getLogger(__name__)
 
+# One keep-alive pool for createTask, every poll, and the image download
+_SESSION = make_session()
+
 class KieAIGenerator:
     """Generate images using kie.ai Nanobanana Pro API"""
 
@@ -22,6 +28,8 @@ class KieAIGenerator:
     MODEL = "nano-banana-pro"
     POLL_URL = "https://api.kie.ai/api/v1/playground/recordInfo"
     POLL_TIMEOUT = 180  # max seconds to wait
+    POLL_INITIAL_INTERVAL = 5  # typical task takes 20–40s — earlier polls are wasted
+    POLL_MAX_INTERVAL = 15
 
     def __init__(self, api_key: Optional[str] = None):
         """Initialize with API key from .env or parameter"""
@@ -29,23 +37,7 @@ class KieAIGenerator:
         if not self.api_key:
             logger.error("Kie.ai API key not configured — set KIE_API_KEY in .env")
 
-    FONT_STYLES = {
-        "ลายมือพู่กัน": "Thai handwritten brush calligraphy, smooth flowing strokes, natural thick-thin variation, soft emotional mood, warm romantic and nostalgic feeling, handwritten title style",
-        "โปสเตอร์หนังไทย": "Thai classic movie poster typography, bold Thai display font, vivid red color, sharp clean edges, vintage Thai cinema style, high readability retro poster look",
-        "โค้งมน ชิลคาเฟ่": "Thai rounded handwritten display font, soft curved letterforms, thick and easy-to-read strokes, chill playlist style, cozy cafe mood, friendly and casual typography",
-        "ชอล์กอินดี้": "Thai handwritten chalk brush typography, rough broken brush strokes, chalk-like texture, raw handmade lettering, indie aesthetic, lonely and emotional mood",
-        "ชอล์กกระดานดำ": "Thai chalk handwritten typography, rough grainy strokes, powdery broken edges, blackboard writing style, quiet and contemplative mood, deep and thoughtful feeling",
-        "ลายมืออินดี้": "Thai indie handwritten typography, natural imperfect strokes, casual hand-drawn lettering, folk music aesthetic, lonely yet warm mood, authentic handwritten feel",
-        "พู่กันสะบัดแรง": "Thai expressive brush calligraphy, fast energetic brush strokes, strong flicks and dynamic movement, clear thick-thin contrast, emotional and powerful handwriting",
-        "พู่กันโรแมนติก": "Thai romantic brush calligraphy, smooth continuous strokes, beautiful thick-thin variation, well-controlled rhythm, warm and romantic mood, elegant handwritten lettering",
-        "พู่กันธรรมชาติ": "Thai organic brush calligraphy, slightly broken natural strokes, visible hand rhythm, uneven thick-thin variation, calm deep and sincere mood, honest handcrafted lettering",
-        "คลาสสิก มีเชิง": "Thai classical serif display typography, elegant traditional letterforms, sharp clean strokes, balanced proportions, refined and warm aesthetic",
-        "โค้งมน นุ่มนวล": "Thai soft decorative handwritten typography, rounded smooth letterforms, gentle strokes with moderate thick-thin balance, warm and romantic feeling, friendly and elegant style",
-        "พู่กันเส้นยาว": "Thai handwritten brush calligraphy, long continuous strokes, natural pressure-based thick-thin variation, rounded stroke endings with trailing tails, raw emotional mood, lonely and realistic handwritten style",
-        "Cursive โรแมนติก": "Thai handwritten calligraphy typography, soft brush pen strokes, flowing cursive Thai letters, natural uneven strokes, romantic and nostalgic mood, handwritten title style, gentle curves, emotional handwriting",
-        "Bold Grunge": "Thai bold sans-serif typography, rough grainy texture, powdery edges, chalk-like broken strokes, slightly blurred distressed text, grunge Thai typography style, raw emotional text",
-        "Modern Brush": "Thai modern handwritten brush typography, bold expressive strokes, clear thick-thin contrast, casual and friendly style",
-    }
+    FONT_STYLES = FONT_STYLES  # shared table — see python/font_styles.py
 
     def generate_album_art(
         self,
@@ -70,26 +62,16 @@ class KieAIGenerator:
 
             prompt = custom_prompt or self._build_prompt(song_title, mood, intensity, video_style, font_style, font_angle, artist)
 
-            payload = {
-                "model": self.MODEL,
-                "input": {
-                    "prompt": prompt,
-                    "aspect_ratio": "9:16",
-                    "resolution": "1K",
-                    "output_format": "png",
-                },
-            }
-
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            }
+            payload = self._payload(prompt)
+
+            # Content-Type is set by requests for json= bodies
+            headers = {"Authorization": f"Bearer {self.api_key}"}
 
             logger.info("Sending request to Kie.ai...")
 
-            response = requests.post(
+            response = _SESSION.post(
                 self.API_URL,
-                data=json.dumps(payload),
+                json=payload,
                 headers=headers,
                 timeout=30,
             )
@@ -98,22 +80,11 @@ class KieAIGenerator:
                 logger.error(f"API Error {response.status_code}: {response.text}")
                 return None
 
-            result = response.json()
-
-            # Async API — extract task ID and poll for result
-            data = result.get("data") or {}
-            task_id = (
-                data.get("taskId")
-                or result.get("taskId")
-                or result.get("id")
-            )
+            result = json_loads(response.content)
 
+            # Async API — extract task ID and poll for result.
             # If response already contains an image URL, use it directly
-            output = data.get("output") or {}
-            image_url = (
-                data.get("url")
-                or output.get("image_url")
-            )
+            task_id, image_url = self._parse_created(result)
             if image_url:
                 return self._download_image(image_url, output_path, song_title)
 
@@ -134,19 +105,89 @@ class KieAIGenerator:
             logger.error(f"Error generating album art: {e}")
             return None
 
+    def _payload(self, prompt: str) -> dict:
+        """createTask body for one 9:16 PNG"""
+        return {
+            "model": self.MODEL,
+            "input": {
+                "prompt": prompt,
+                "aspect_ratio": "9:16",
+                "resolution": "1K",
+                "output_format": "png",
+            },
+        }
+
+    @staticmethod
+    def _parse_created(result: dict):
+        """(task_id, image_url) from a createTask response — either may be None"""
+        data = result.get("data") or {}
+        task_id = (
+            data.get("taskId")
+            or result.get("taskId")
+            or result.get("id")
+        )
+        output = data.get("output") or {}
+        image_url = (
+            data.get("url")
+            or output.get("image_url")
+        )
+        return task_id, image_url
+
+    @staticmethod
+    def _task_status(data: dict):
+        """State string from a recordInfo poll response"""
+        return (
+            data.get("data", {}).get("state")
+            or data.get("data", {}).get("status")
+            or data.get("status")
+        )
+
+    @staticmethod
+    def _result_url(task_data: dict) -> Optional[str]:
+        """Image URL from a completed task's data"""
+        # Kie.ai returns URL in resultJson string
+        result_json_str = task_data.get("resultJson")
+        if result_json_str:
+            try:
+                result_obj = json_loads(result_json_str)
+                urls = result_obj.get("resultUrls", [])
+                if urls:
+                    return urls[0]
+            except json.JSONDecodeError:
+                pass
+        # Fallback: try common response shapes
+        output = task_data.get("output", {})
+        return (
+            output.get("image_url")
+            or output.get("url")
+            or task_data.get("url")
+        )
+
+    def _next_interval(self, interval: float, data: Optional[dict], elapsed: float) -> float:
+        """Sleep before the next poll — progress-based when reported, else backoff"""
+        # If the API reports progress, sleep ~half the estimated remaining time
+        progress = (data or {}).get("data", {}).get("progress")
+        if isinstance(progress, (int, float)) and 0 < progress < 100:
+            remaining = elapsed * (100 - progress) / progress
+            return min(max(remaining * 0.5, self.POLL_INITIAL_INTERVAL),
+                       self.POLL_MAX_INTERVAL)
+        # Exponential backoff 5 → 8 → 13 → 15 (capped), jittered so batched
+        # tasks don't all poll in lockstep
+        return min(interval * 1.6, self.POLL_MAX_INTERVAL) + random.uniform(0, 1)
+
     def _poll_task(self, task_id: str, headers: dict) -> Optional[str]:
-        """Poll task status until complete or timeout (exponential backoff)"""
+        """Poll task status until complete or timeout (jittered exponential backoff)"""
+        start = time.monotonic()
         elapsed = 0
-        interval = 2  # start at 2s
-        max_interval = 8
+        interval = self.POLL_INITIAL_INTERVAL
 
         while elapsed < self.POLL_TIMEOUT:
             time.sleep(interval)
-            elapsed += interval
+            elapsed = int(time.monotonic() - start)
 
             try:
                 poll_url = f"{self.POLL_URL}?taskId={task_id}"
-                resp = requests.get(
+                resp = _SESSION.get(
                     poll_url,
                     headers=headers,
                     timeout=15,
@@ -155,33 +196,12 @@ class KieAIGenerator:
                     logger.warning(f"Poll status {resp.status_code}, retrying... ({elapsed}s)")
                     continue
 
-                data = resp.json()
-                status = (
-                    data.get("data", {}).get("state")
-                    or data.get("data", {}).get("status")
-                    or data.get("status")
-                )
+                data = json_loads(resp.content)
+                status = self._task_status(data)
                 logger.info(f"Task {task_id[:12]}...: {status} ({elapsed}s)")
 
                 if status in ("completed", "success", "done"):
-                    task_data = data.get("data", {})
-                    # Kie.ai returns URL in resultJson string
-                    result_json_str = task_data.get("resultJson")
-                    if result_json_str:
-                        try:
-                            result_obj = json.loads(result_json_str)
-                            urls = result_obj.get("resultUrls", [])
-                            if urls:
-                                return urls[0]
-                        except json.JSONDecodeError:
-                            pass
-                    # Fallback: try common response shapes
-                    output = task_data.get("output", {})
-                    url = (
-                        output.get("image_url")
-                        or output.get("url")
-                        or task_data.get("url")
-                    )
+                    url = self._result_url(data.get("data", {}))
                     if url:
                         return url
                     logger.error(f"Task done but no image URL: {data}")
@@ -193,43 +213,16 @@ class KieAIGenerator:
 
             except Exception as e:
                 logger.warning(f"Poll error: {e}")
+                data = None
 
-            # Exponential backoff: 2 → 3 → 4 → 6 → 8 (capped)
-            interval = min(math.ceil(interval * 1.5), max_interval)
+            interval = self._next_interval(interval, data, elapsed)
 
         logger.error(f"Task {task_id[:12]}... timed out after {self.POLL_TIMEOUT}s")
         return None
 
     def _build_prompt(self, song_title: str, mood: str, intensity: str, video_style: str = 'Thai', font_style: str = 'ลายมือพู่กัน', font_angle: str = 'เฉียงขึ้น', artist: str = '') -> str:
-        """
-        Build optimized prompt for Nanobanana Pro
-
-        Prompt structure:
-        [images concept & caption & title & mood: {Song} by {Artist}]
-        [subject: visual representation]
-        [{video_style} music video style]
-        [font style + angle from user selection]
-        """
-
-        # Get font prompt from style map
-        font_prompt = self.FONT_STYLES.get(font_style, self.FONT_STYLES["ลายมือพู่กัน"])
-
-        # Add angle to font prompt
-        if font_angle == "เฉียงขึ้น":
-            font_prompt += ", tilted upward angle, dynamic slanted text"
-
-        # Song title with artist
-        title_part = f"{song_title} by {artist}" if artist else song_title
-
-        # Build comprehensive prompt
-        prompt = (
-            f"[images concept & caption & title & mood: {title_part}]"
-            f"[subject: คนที่สื่อความหมายถึงอารมณ์เพลง]"
-            f"[{video_style} Music video style]"
-            f"[{font_prompt}]"
-        )
-
-        return prompt
+        """Build optimized prompt for Nanobanana Pro (template in python/font_styles.py)"""
+        return build_prompt(song_title, video_style, font_style, font_angle, artist)
 
     def _download_image(
         self,
@@ -248,16 +241,18 @@ class KieAIGenerator:
 
             logger.info(f"Downloading image to {output_path}...")
 
-            img_response = requests.get(image_url, timeout=60)
-            if img_response.status_code == 200:
+            # Stream to disk in 64 KB chunks — peak memory stays flat
+            # regardless of image size (matters when batches run concurrently)
+            with _SESSION.get(image_url, timeout=60, stream=True) as img_response:
+                if img_response.status_code != 200:
+                    logger.error(f"Failed to download image: {img_response.status_code}")
+                    return None
                 with open(output_path, 'wb') as f:
-                    f.write(img_response.content)
+                    for chunk in img_response.iter_content(chunk_size=65536):
+                        f.write(chunk)
 
-                logger.info(f"Image saved: {output_path}")
-                return output_path
-            else:
-                logger.error(f"Failed to download image: {img_response.status_code}")
-                return None
+            logger.info(f"Image saved: {output_path}")
+            return output_path
 
         except Exception as e:
             logger.error(f"Error downloading image: {e}")
@@ -266,37 +261,49 @@ class KieAIGenerator:
     def generate_batch(
         self,
         songs: list,
-        output_folder: str = './outputs'
+        output_folder: str = './outputs',
+        max_workers: int = 8,
     ) -> Dict[str, str]:
         """
-        Generate images for multiple songs
+        Generate images for multiple songs concurrently
+
+        Each song is a createTask call plus up to POLL_TIMEOUT of polling —
+        network-bound, so songs run on a thread pool instead of one by one.
 
         Args:
             songs: List of dicts with 'title', 'mood', 'intensity'
             output_folder: Where to save images
+            max_workers: Max songs in flight at once (keep within Kie.ai rate limit)
 
         Returns:
             Dict mapping song title to image path
         """
         results = {}
+        if not songs:
+            return results
 
-        for i, song_info in enumerate(songs, 1):
-            logger.info(f"\n[{i}/{len(songs)}] Processing: {song_info['title']}")
-
+        def _one(song_info: dict):
             output_path = Path(output_folder) / f"{song_info['title'].replace(' ', '_')}.png"
-
             image_path = self.generate_album_art(
                 song_title=song_info['title'],
                 mood=song_info['mood'],
                 intensity=song_info.get('intensity', 'medium'),
                 output_path=str(output_path)
             )
-
-            if image_path:
-                results[song_info['title']] = image_path
-
-            # Rate limit - be nice to API
-            if i < len(songs):
-                time.sleep(2)
+            return song_info['title'], image_path
+
+        # Identical prompts (e.g. the same song listed twice) are generated once —
+        # they'd also race on the same output file now that songs run concurrently
+        unique = list({build_prompt(song_info['title']): song_info for song_info in songs}.values())
+        if len(unique) < len(songs):
+            logger.info(f"Skipping {len(songs) - len(unique)} duplicate song(s) in batch")
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as pool:
+            futures = [pool.submit(_one, song_info) for song_info in unique]
+            for i, future in enumerate(as_completed(futures), 1):
+                title, image_path = future.result()
+                logger.info(f"[{i}/{len(unique)}] Done: {title}")
+                if image_path:
+                    results[title] = image_path
 
         return results
@@ -7,6 +7,13 @@ import os
 import sys
 import logging
 import argparse
+import subprocess
+import glob
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 # Add parent directory
@@ -16,12 +23,6 @@ import soundfile as _sf
 if not hasattr(_sf, 'SoundFileRuntimeError'):
     _sf.SoundFileRuntimeError = RuntimeError
 
-try:
-    from pychorus import find_and_output_chorus
-except ImportError:
-    print("⚠️  pychorus not installed. Install with: pip install pychorus")
-    sys.exit(1)
-
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -30,6 +31,12 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 SUPPORTED_FORMATS = ('.mp3', '.wav', '.flac', '.ogg', '.m4a', '.aac')
+# Decoded directly by libsndfile — no ffmpeg/audioread subprocess
+SNDFILE_FORMATS = ('.wav', '.flac', '.ogg')
+_SUPPORTED_EXTS = frozenset(SUPPORTED_FORMATS)
+_SNDFILE_EXTS = frozenset(SNDFILE_FORMATS)
+# Chroma tops out near C8 (~4.2 kHz) — anything above 22.05 kHz is wasted STFT work
+ANALYSIS_SR = 22050
 
 def validate_input_file(file_path):
     """Validate input file exists and is supported format"""
@@ -37,13 +44,108 @@ def validate_input_file(file_path):
         logger.error(f"File not found: {file_path}")
         return False
     
-    if not file_path.lower().endswith(SUPPORTED_FORMATS):
+    if os.path.splitext(file_path)[1].lower() not in _SUPPORTED_EXTS:
         logger.error(f"Unsupported format. Supported: {SUPPORTED_FORMATS}")
         return False
     
     return True
 
-def extract_hook(input_file, output_file, clip_length=30):
+def _fast_load(path):
+    """Decode a WAV/FLAC/OGG file with soundfile → (mono float32 samples, sample rate)"""
+    data, sr = _sf.read(path, dtype='float32', always_2d=False)
+    if data.ndim == 2:
+        data = data.mean(axis=1)
+    return data, sr
+
+def read_ffmpeg(infile, sample_rate=22050):
+    """
+    Decode any ffmpeg-readable file (MP3/M4A/AAC) straight into memory
+    as mono float32 PCM — no temp WAV, no audioread. 22050 Hz matches
+    librosa.load's default, so chorus detection sees the same signal.
+
+    Returns: (samples, sample_rate)
+    """
+    import numpy as np
+
+    out = subprocess.check_output(
+        ['ffmpeg', '-v', 'quiet', '-i', infile,
+         '-f', 'f32le', '-ar', str(sample_rate), '-ac', '1', 'pipe:1'],
+        stdin=subprocess.DEVNULL, timeout=300,
+    )
+    return np.frombuffer(out, dtype=np.float32), sample_rate
+
+def _chroma_from_samples(y, sr, n_fft=2**14, analysis_sr=ANALYSIS_SR):
+    """
+    Same chroma as pychorus.helpers.create_chroma, from already-decoded samples
+
+    Input above analysis_sr is resampled first (create_chroma's librosa.load
+    does the same at 22050), so a 44.1/48 kHz WAV costs half the STFT.
+    Chroma frames still span the whole song, so chorus timing is unchanged.
+    """
+    import numpy as np
+    import librosa
+
+    if sr > analysis_sr:
+        from scipy.signal import resample_poly
+        y = resample_poly(y, analysis_sr, sr)
+        sr = analysis_sr
+
+    S = np.abs(librosa.stft(y, n_fft=n_fft)) ** 2
+    return librosa.feature.chroma_stft(S=S, sr=sr)
+
+def _file_key(path):
+    """Cache key for a file's analysis — changes whenever the file is rewritten"""
+    st = os.stat(path)
+    return os.path.abspath(path), st.st_mtime_ns, st.st_size
+
+def _decode(path):
+    """
+    Decode a song to mono samples at the file's own rate
+
+    soundfile for WAV/FLAC/OGG, ffmpeg for the rest, librosa (22050 Hz,
+    as pychorus.create_chroma) if ffmpeg can't read it.
+    Returns: (samples, sample_rate)
+    """
+    if os.path.splitext(path)[1].lower() in _SNDFILE_EXTS:
+        return _fast_load(path)
+    try:
+        samples, sr = read_ffmpeg(path)
+        if len(samples):
+            return samples, sr
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"ffmpeg decode failed ({e}) — falling back to librosa")
+
+    import librosa
+    return librosa.load(path)
+
+# Chroma only — a 12 x frames matrix, a few hundred KB per song. Decoded
+# samples are never kept, so the GUI process doesn't hold whole songs.
+_CHROMA_CACHE_SIZE = 8
+_chroma_cache = OrderedDict()
+_chroma_lock = threading.Lock()
+
+def _chroma_for(key, samples, sr, analysis_sr=ANALYSIS_SR):
+    """
+    Chromagram for one file version, memoized on (file key, analysis_sr)
+
+    Chorus detection always uses the same 15s window, so the chroma does
+    not depend on clip_length — retrying with another length skips the STFT.
+    """
+    cache_key = (key, analysis_sr)
+    with _chroma_lock:
+        chroma = _chroma_cache.get(cache_key)
+        if chroma is not None:
+            _chroma_cache.move_to_end(cache_key)
+            return chroma
+
+    chroma = _chroma_from_samples(samples, sr, analysis_sr=analysis_sr)
+    with _chroma_lock:
+        _chroma_cache[cache_key] = chroma
+        while len(_chroma_cache) > _CHROMA_CACHE_SIZE:
+            _chroma_cache.popitem(last=False)
+    return chroma
+
+def extract_hook(input_file, output_file, clip_length=30, analysis_sr=ANALYSIS_SR):
     """
     Extract the chorus/hook from audio file
 
@@ -54,6 +156,7 @@ def extract_hook(input_file, output_file, clip_length=30):
         input_file: Path to input audio
         output_file: Where to save hook
         clip_length: Length in seconds of the output clip
+        analysis_sr: Max sample rate for chorus analysis (output keeps the source rate)
 
     Returns:
         bool: Success status
@@ -66,10 +169,18 @@ def extract_hook(input_file, output_file, clip_length=30):
     try:
         # Always detect chorus with 15s search window (reliable),
         # then cut clip_length from that position
-        from pychorus.helpers import create_chroma, find_chorus
+        try:
+            from python.chorus_fast import find_chorus  # numba build, if installed
+        except ImportError:
+            from pychorus.helpers import find_chorus
+        import numpy as np
         import soundfile as sf
 
-        chroma, song_wav_data, sr, song_length_sec = create_chroma(input_file)
+        # Samples are re-decoded every call (needed for the cut anyway);
+        # only the STFT/chroma is cached
+        song_wav_data, sr = _decode(input_file)
+        song_length_sec = len(song_wav_data) / sr
+        chroma = _chroma_for(_file_key(input_file), song_wav_data, sr, analysis_sr)
 
         # Use 15s for detection — works reliably
         DETECT_LENGTH = 15
@@ -90,8 +201,11 @@ def extract_hook(input_file, output_file, clip_length=30):
         end_sec = min(chorus_start + clip_length, song_length_sec)
         actual_length = end_sec - chorus_start
 
-        chorus_data = song_wav_data[int(chorus_start * sr):int(end_sec * sr)]
-        sf.write(output_file, chorus_data, sr)
+        # Contiguous float32 once (no-op for soundfile/ffmpeg/librosa arrays),
+        # then write a slice view — no copy of the clip before encoding
+        song_wav_data = np.ascontiguousarray(song_wav_data, dtype=np.float32)
+        i0, i1 = int(chorus_start * sr), int(end_sec * sr)
+        sf.write(output_file, song_wav_data[i0:i1], sr, subtype='PCM_16')
 
         logger.info(f"Hook extracted: {actual_length:.1f}s from {chorus_start:.2f}s")
         logger.info(f"Saved to: {output_file}")
@@ -101,6 +215,63 @@ def extract_hook(input_file, output_file, clip_length=30):
         logger.error(f"Error extracting hook: {e}")
         return False
 
+def _init_batch_worker(log_queue):
+    """Worker process: send log records to the parent so lines never interleave"""
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(logging.INFO)
+
+def extract_hooks_batch(inputs, outputs, clip_length=30, max_workers=None,
+                        analysis_sr=ANALYSIS_SR):
+    """
+    Extract hooks for many files in parallel worker processes
+
+    Chroma + chorus search is CPU-bound and holds the GIL outside numpy,
+    so files run in separate processes rather than threads.
+
+    Args:
+        inputs: Input audio paths
+        outputs: Output hook paths (same length as inputs)
+        clip_length: Length in seconds of each output clip
+        max_workers: Worker processes (default: CPU count)
+        analysis_sr: Max sample rate for chorus analysis
+
+    Returns:
+        dict: input path -> success
+    """
+    if len(inputs) != len(outputs):
+        raise ValueError("inputs and outputs must have the same length")
+
+    results = {}
+    log_queue = multiprocessing.Queue()
+    listener = QueueListener(log_queue, *logging.getLogger().handlers)
+    listener.start()
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                                 initializer=_init_batch_worker,
+                                 initargs=(log_queue,)) as pool:
+            futures = {
+                pool.submit(extract_hook, src, dst, clip_length, analysis_sr): src
+                for src, dst in zip(inputs, outputs)
+            }
+            for future in as_completed(futures):
+                src = futures[future]
+                try:
+                    results[src] = future.result()
+                except Exception as e:
+                    logger.error(f"Worker failed for {Path(src).name}: {e}")
+                    results[src] = False
+    finally:
+        listener.stop()
+
+    return results
+
+def _default_output(input_file, output_dir=None):
+    base, ext = os.path.splitext(input_file)
+    if output_dir:
+        base = os.path.join(output_dir, os.path.basename(base))
+    return f"{base}_hook{ext}"
+
 def main():
     parser = argparse.ArgumentParser(
         description="Extract music hook/chorus from audio file",
@@ -109,16 +280,18 @@ def main():
 Examples:
   python main.py input.mp3
   python main.py input.mp3 -o hook.mp3 -l 20
+  python main.py "downloads/*.mp3" -o hooks/ -j 4
         """
     )
     
     parser.add_argument(
         "input",
-        help="Path to input audio file (mp3, wav, flac, ogg, m4a, aac)"
+        nargs="+",
+        help="Input audio file(s) or glob pattern(s) (mp3, wav, flac, ogg, m4a, aac)"
     )
     parser.add_argument(
         "-o", "--output",
-        help="Path to output hook file (optional)"
+        help="Output hook file (single input) or output folder (batch) — optional"
     )
     parser.add_argument(
         "-l", "--length",
@@ -126,18 +299,45 @@ Examples:
         default=30,
         help="Hook duration in seconds (default: 30)"
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for batch mode (default: CPU count)"
+    )
+    parser.add_argument(
+        "--sr",
+        type=int,
+        default=ANALYSIS_SR,
+        help=f"Sample rate for chorus analysis — lower is faster (default: {ANALYSIS_SR})"
+    )
     
     args = parser.parse_args()
-    
-    # Generate output filename if not provided
-    if not args.output:
-        base, ext = os.path.splitext(args.input)
-        args.output = f"{base}_hook{ext}"
-    
-    # Extract hook
-    success = extract_hook(args.input, args.output, args.length)
-    
-    sys.exit(0 if success else 1)
+
+    # Expand globs ourselves — cmd.exe doesn't
+    inputs = []
+    for pattern in args.input:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        inputs.extend(matches)
+
+    if not inputs:
+        logger.error("No input files matched")
+        sys.exit(1)
+
+    if len(inputs) == 1:
+        # Generate output filename if not provided
+        output = args.output or _default_output(inputs[0])
+        success = extract_hook(inputs[0], output, args.length, args.sr)
+        sys.exit(0 if success else 1)
+
+    # Batch: -o is a folder
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+    outputs = [_default_output(f, args.output) for f in inputs]
+    results = extract_hooks_batch(inputs, outputs, args.length, args.jobs, args.sr)
+    ok = sum(results.values())
+    logger.info(f"Batch done: {ok}/{len(inputs)} hooks extracted")
+    sys.exit(0 if ok == len(inputs) else 1)
 
 if __name__ == "__main__":
     main()
@@ -3,8 +3,10 @@ YouTube metadata extraction and mood detection
 """
 
 import re
+import functools
 import logging
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -18,101 +20,208 @@ MOOD_KEYWORDS = {
     'angry': ['angry', 'rage', 'dark', 'aggressive', 'fight', 'rebel', 'scream', 'violent'],
 }
 
+# Checked in order — first label with any keyword in "artist title" wins
+INTENSITY_KEYWORDS = {
+    'high': ['epic', 'extreme', 'ultimate', 'super', 'ultra'],
+    'low': ['subtle', 'light', 'soft', 'quiet'],
+}
+
+VIBE_KEYWORDS = {
+    'live': ['live', 'concert', 'performance'],
+    'remix': ['remix', 'cover', 'version'],
+}
+
+# Optional: pyahocorasick scans all keywords in one pass (regex fallback)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _keyword_tables():
+    return (('mood', MOOD_KEYWORDS), ('intensity', INTENSITY_KEYWORDS), ('vibe', VIBE_KEYWORDS))
+
+
+def _build_automaton():
+    """One automaton over every keyword → (keyword, ((category, label), ...))"""
+    tags = {}
+    for category, table in _keyword_tables():
+        for label, keywords in table.items():
+            for kw in keywords:
+                tags.setdefault(kw, []).append((category, label))  # 'love' is happy + romantic
+
+    automaton = ahocorasick.Automaton()
+    for kw, kw_tags in tags.items():
+        automaton.add_word(kw, (kw, tuple(kw_tags)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_patterns():
+    """
+    Regex fallback: one pattern per mood plus one combined pattern for
+    intensity/vibe with a named group per label. The lookahead matches at
+    every position, so overlapping keywords ('heart' inside 'heartbreak'
+    belongs to another mood) are still found, like a plain `in` scan.
+    """
+    def alternation(keywords):
+        return '|'.join(map(re.escape, keywords))
+
+    moods = {mood: re.compile(f'(?=({alternation(keywords)}))')
+             for mood, keywords in MOOD_KEYWORDS.items()}
+    features = re.compile('(?=(?:' + '|'.join(
+        f'(?P<{category}_{label}>{alternation(keywords)})'
+        for category, table in _keyword_tables()[1:]
+        for label, keywords in table.items()
+    ) + '))')
+    return moods, features
+
+
+# Highest-priority label per category — once both are found nothing can outrank them
+_TOP_FEATURES = frozenset({('intensity', next(iter(INTENSITY_KEYWORDS))),
+                           ('vibe', next(iter(VIBE_KEYWORDS)))})
+
+_MATCHER = None  # automaton or compiled regexes — built on first use, shared
+
+
+def _get_matcher():
+    global _MATCHER
+    if _MATCHER is None:
+        _MATCHER = _build_automaton() if ahocorasick is not None else _build_patterns()
+    return _MATCHER
+
+
+def _keyword_hits(text: str, categories) -> Dict[tuple, set]:
+    """(category, label) → distinct keywords found in lowercased text"""
+    matcher = _get_matcher()
+    hits = {}
+    if ahocorasick is not None:
+        for _, (kw, kw_tags) in matcher.iter(text):
+            for tag in kw_tags:
+                if tag[0] in categories:
+                    hits.setdefault(tag, set()).add(kw)
+        return hits
+
+    moods, features = matcher
+    if 'mood' in categories:
+        for mood, pattern in moods.items():
+            found = {m.group(1) for m in pattern.finditer(text)}
+            if found:
+                hits[('mood', mood)] = found
+    if 'intensity' in categories or 'vibe' in categories:
+        # One scan for every intensity/vibe label — presence is all that matters,
+        # so stop as soon as the winning label of each category has been seen
+        for m in features.finditer(text):
+            category, label = m.lastgroup.split('_', 1)
+            hits.setdefault((category, label), set()).add(m.group(m.lastgroup))
+            if _TOP_FEATURES.issubset(hits.keys()):
+                break
+    return hits
+
+
+# Titles repeat across batches/retries — results are memoized per lowercased text
+@functools.lru_cache(maxsize=2048)
+def _mood_of(title_lower: str) -> Optional[str]:
+    """Best-scoring mood, or None when no keyword matches"""
+    hits = _keyword_hits(title_lower, ('mood',))
+    # Score = distinct keywords matched; ties go to the earlier mood in MOOD_KEYWORDS
+    mood_scores = {mood: len(hits[('mood', mood)])
+                   for mood in MOOD_KEYWORDS if ('mood', mood) in hits}
+    if mood_scores:
+        return max(mood_scores, key=mood_scores.get)
+    return None
+
+
+@functools.lru_cache(maxsize=2048)
+def _features_of(full_lower: str) -> tuple:
+    """(intensity, vibe) from lowercased "artist title" — first label in table order wins"""
+    hits = _keyword_hits(full_lower, ('intensity', 'vibe'))
+    intensity = next((label for label in INTENSITY_KEYWORDS if ('intensity', label) in hits), 'medium')
+    vibe = next((label for label in VIBE_KEYWORDS if ('vibe', label) in hits), 'studio')
+    return intensity, vibe
+
+
+def detect_mood(title: str, default: str = 'calm') -> str:
+    """
+    Mood for a song title — MoodDetector.detect_from_title without the
+    instance: one lowercase + one cached lookup for hot batch loops.
+    """
+    return _mood_of(title.lower()) or default
+
+
+# Thai description per mood — read-only, shared by every call
+_MOOD_DESCRIPTIONS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    'happy': MappingProxyType({
+        'emotion': 'ความสุข',
+        'color': '#FFD700',  # Gold
+        'energy': 'สูง',
+        'style': 'สดใส, ชีวชีวะ'
+    }),
+    'sad': MappingProxyType({
+        'emotion': 'ความเศร้า',
+        'color': '#4169E1',  # Royal Blue
+        'energy': 'ต่ำ',
+        'style': 'เศร้าสลึง, ลึกลับ'
+    }),
+    'energetic': MappingProxyType({
+        'emotion': 'พลังแรง',
+        'color': '#FF4500',  # Orange Red
+        'energy': 'สูงมาก',
+        'style': 'แรงกล้า, ระเบิด'
+    }),
+    'calm': MappingProxyType({
+        'emotion': 'ความสงบ',
+        'color': '#87CEEB',  # Sky Blue
+        'energy': 'ต่ำ',
+        'style': 'นิ่ง, สงบสุข'
+    }),
+    'romantic': MappingProxyType({
+        'emotion': 'ความรักหวัน',
+        'color': '#FF1493',  # Deep Pink
+        'energy': 'ปานกลาง',
+        'style': 'หวาน, หวังใจ'
+    }),
+    'angry': MappingProxyType({
+        'emotion': 'ความโกรธ',
+        'color': '#DC143C',  # Crimson
+        'energy': 'สูงมาก',
+        'style': 'ดุดัน, ขุ่นเคือง'
+    }),
+})
+_DEFAULT_DESC = _MOOD_DESCRIPTIONS['calm']
+
 class MoodDetector:
     """Detect mood from song title and metadata"""
-    
+
     def __init__(self):
         self.mood_map = MOOD_KEYWORDS
         self.default_mood = 'calm'
-    
+        _get_matcher()
+
     def detect_from_title(self, title: str) -> str:
         """Detect mood from song title"""
-        title_lower = title.lower()
-        
-        # Count matches for each mood
-        mood_scores = {}
-        for mood, keywords in self.mood_map.items():
-            score = sum(1 for keyword in keywords if keyword in title_lower)
-            if score > 0:
-                mood_scores[mood] = score
-        
-        if mood_scores:
-            return max(mood_scores, key=mood_scores.get)
-        
-        return self.default_mood
-    
+        return detect_mood(title, self.default_mood)
+
     def detect_from_artist_title(self, artist: str, title: str) -> Dict[str, str]:
         """
         Detect mood from artist + title
         Returns: {mood, intensity, vibe}
         """
-        full_text = f"{artist} {title}".lower()
-        
-        mood = self.detect_from_title(title)
-        
-        # Detect intensity
-        intensity = 'medium'
-        intense_keywords = ['epic', 'extreme', 'ultimate', 'super', 'ultra']
-        if any(kw in full_text for kw in intense_keywords):
-            intensity = 'high'
-        elif any(kw in full_text for kw in ['subtle', 'light', 'soft', 'quiet']):
-            intensity = 'low'
-        
-        # Detect vibe
-        vibe = 'studio'
-        if any(kw in full_text for kw in ['live', 'concert', 'performance']):
-            vibe = 'live'
-        elif any(kw in full_text for kw in ['remix', 'cover', 'version']):
-            vibe = 'remix'
-        
+        title_lower = title.lower()
+
+        # Mood reads the title only; intensity/vibe read "artist title"
+        mood = _mood_of(title_lower) or self.default_mood
+        intensity, vibe = _features_of(f"{artist.lower()} {title_lower}")
+
         return {
             'mood': mood,
             'intensity': intensity,
             'vibe': vibe,
         }
-    
-    def get_mood_description(self, mood: str) -> Dict[str, str]:
+
+    def get_mood_description(self, mood: str) -> Mapping[str, str]:
         """Get Thai description for mood"""
-        mood_descriptions = {
-            'happy': {
-                'emotion': 'ความสุข',
-                'color': '#FFD700',  # Gold
-                'energy': 'สูง',
-                'style': 'สดใส, ชีวชีวะ'
-            },
-            'sad': {
-                'emotion': 'ความเศร้า',
-                'color': '#4169E1',  # Royal Blue
-                'energy': 'ต่ำ',
-                'style': 'เศร้าสลึง, ลึกลับ'
-            },
-            'energetic': {
-                'emotion': 'พลังแรง',
-                'color': '#FF4500',  # Orange Red
-                'energy': 'สูงมาก',
-                'style': 'แรงกล้า, ระเบิด'
-            },
-            'calm': {
-                'emotion': 'ความสงบ',
-                'color': '#87CEEB',  # Sky Blue
-                'energy': 'ต่ำ',
-                'style': 'นิ่ง, สงบสุข'
-            },
-            'romantic': {
-                'emotion': 'ความรักหวัน',
-                'color': '#FF1493',  # Deep Pink
-                'energy': 'ปานกลาง',
-                'style': 'หวาน, หวังใจ'
-            },
-            'angry': {
-                'emotion': 'ความโกรธ',
-                'color': '#DC143C',  # Crimson
-                'energy': 'สูงมาก',
-                'style': 'ดุดัน, ขุ่นเคือง'
-            },
-        }
-        
-        return mood_descriptions.get(mood, mood_descriptions['calm'])
+        return _MOOD_DESCRIPTIONS.get(mood, _DEFAULT_DESC)
 
 
 def extract_metadata_from_title(title: str) -> Dict[str, str]:
@@ -120,23 +229,17 @@ def extract_metadata_from_title(title: str) -> Dict[str, str]:
     Extract song info from YouTube title
     Handle patterns like: "Song Name - Artist" or "Artist - Song Name"
     """
-    # Try to split by dash
-    if ' - ' in title:
-        parts = title.split(' - ', 1)
-        # Heuristic: longer part is usually song name
-        return {
-            'artist': parts[0].strip(),
-            'song': parts[1].strip(),
-        }
-    
-    # Try to split by '|'
-    if ' | ' in title:
-        parts = title.split(' | ', 1)
+    # Split at the first ' - ', else the first ' | ' (one C-level find+split each)
+    # Heuristic: left part is the artist
+    artist, sep, song = title.partition(' - ')
+    if not sep:
+        artist, sep, song = title.partition(' | ')
+    if sep:
         return {
-            'artist': parts[0].strip(),
-            'song': parts[1].strip(),
+            'artist': artist.strip(),
+            'song': song.strip(),
         }
-    
+
     # Can't split - use whole as song name
     return {
         'artist': 'Unknown Artist',
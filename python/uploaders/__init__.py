@@ -5,9 +5,10 @@ Hook-to-Short — Social Media Uploaders
 
 import os
 import time
+import functools
 import random as _random
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Optional, Callable
@@ -15,7 +16,9 @@ from typing import Optional, Callable
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 2
-RETRY_DELAYS = [5, 15]  # seconds between retries
+RETRY_BASE_DELAY = 5.0   # seconds before the first retry
+RETRY_MAX_DELAY = 30.0   # cap for a single backoff delay
+RETRY_JITTER = 0.5       # +/- fraction applied to each delay
 
 
 class UploadStatus(Enum):
@@ -25,22 +28,24 @@ class UploadStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UploadResult:
     platform: str
     status: UploadStatus
     url: Optional[str] = None
     video_id: Optional[str] = None
     error: Optional[str] = None
+    retryable: bool = True  # False = auth/config/file error — retrying won't help
+    attempts: int = 1       # calls made by upload_with_retry (1 = no retry)
 
 
-@dataclass
+@dataclass(slots=True)
 class UploadRequest:
     """All info needed to upload a video to any platform."""
     video_path: str
     title: str
     description: str = ""
-    tags: list[str] = field(default_factory=list)
+    tags: tuple[str, ...] = ()  # hashable — see render_hashtags()
     privacy: str = "public"  # public, private, unlisted
     publish_at: Optional[str] = None  # ISO 8601 datetime for scheduling
 
@@ -69,37 +74,82 @@ PUBLISH_MODES: dict[str, Optional[int]] = {
 }
 
 
+_ICT = timezone(timedelta(hours=7))
+_DEFAULT_PEAK_HOURS = [(12, 15), (19, 21)]
+_PUBLISH_MINUTES = (0, 15, 30, 45)
+
+
+def _publish_slots(ranges: list[tuple[int, int]]) -> tuple[list[tuple[int, int]], list[float]]:
+    """Every (hour, minute) slot + cumulative weights: each peak range gets equal
+    probability, split evenly over its slots (same odds as picking range, then hour)."""
+    slots, cum_weights, total = [], [], 0.0
+    for start_h, end_h in ranges:
+        range_slots = [(h, m) for h in range(start_h, end_h) for m in _PUBLISH_MINUTES]
+        for slot in range_slots:
+            total += 1 / (len(ranges) * len(range_slots))
+            slots.append(slot)
+            cum_weights.append(total)
+    return slots, cum_weights
+
+
+_PUBLISH_SLOTS = {platform: _publish_slots(ranges) for platform, ranges in PEAK_HOURS.items()}
+_DEFAULT_PUBLISH_SLOTS = _publish_slots(_DEFAULT_PEAK_HOURS)
+
+
 def calculate_publish_time(platform: str, days_offset: int) -> str:
     """Calculate optimal publish time for a platform.
 
     Returns ISO 8601 datetime string with timezone (ICT +07:00).
     Picks a random hour from the platform's peak engagement windows.
     """
-    ict = timezone(timedelta(hours=7))
-    now = datetime.now(ict)
+    now = datetime.now(_ICT)
     target_date = now + timedelta(days=days_offset)
 
-    ranges = PEAK_HOURS.get(platform, [(12, 15), (19, 21)])
-    start_h, end_h = _random.choice(ranges)
-    hour = _random.randint(start_h, end_h - 1)
-    minute = _random.choice([0, 15, 30, 45])
+    slots, cum_weights = _PUBLISH_SLOTS.get(platform, _DEFAULT_PUBLISH_SLOTS)
+    hour, minute = _random.choices(slots, cum_weights=cum_weights)[0]
 
     publish_time = target_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
     return publish_time.isoformat()
 
 
+@functools.lru_cache(maxsize=128)
+def render_hashtags(tags: tuple[str, ...]) -> str:
+    """"#a #b #c" — cached, since a batch reuses the same tag set for every video."""
+    return " ".join("#" + t for t in tags)
+
+
+def retry_delay(attempt: int, base_delay: float = RETRY_BASE_DELAY,
+                max_delay: float = RETRY_MAX_DELAY, jitter: float = RETRY_JITTER) -> float:
+    """Exponential backoff delay for a 0-based retry attempt, with +/- jitter."""
+    delay = min(max_delay, base_delay * 2 ** attempt)
+    return delay * (1 + _random.uniform(-jitter, jitter))
+
+
 def upload_with_retry(upload_fn: Callable[[], UploadResult],
-                      max_retries: int = MAX_RETRIES) -> UploadResult:
-    """Retry an upload function on failure with exponential backoff."""
+                      max_retries: int = MAX_RETRIES,
+                      base_delay: float = RETRY_BASE_DELAY,
+                      max_delay: float = RETRY_MAX_DELAY,
+                      jitter: float = RETRY_JITTER) -> UploadResult:
+    """Retry an upload function on failure with exponential backoff + jitter.
+
+    Results marked ``retryable=False`` (not logged in, missing file, ...)
+    are returned immediately without sleeping. The returned result's
+    ``attempts`` says how many calls were made.
+    """
     last_result = None
     for attempt in range(1 + max_retries):
         result = upload_fn()
+        if attempt:
+            result = replace(result, attempts=attempt + 1)
         if result.status == UploadStatus.SUCCESS:
             return result
         last_result = result
+        if not result.retryable:
+            logger.info(f"{result.platform}: ข้อผิดพลาดนี้ลองใหม่ไม่ได้ — {result.error}")
+            break
         if attempt < max_retries:
-            delay = RETRY_DELAYS[min(attempt, len(RETRY_DELAYS) - 1)]
-            logger.info(f"{result.platform}: ลองใหม่ครั้งที่ {attempt + 1} (รอ {delay} วินาที)...")
+            delay = retry_delay(attempt, base_delay, max_delay, jitter)
+            logger.info(f"{result.platform}: ลองใหม่ครั้งที่ {attempt + 1} (รอ {delay:.1f} วินาที)...")
             time.sleep(delay)
     return last_result
 
@@ -107,12 +157,19 @@ def upload_with_retry(upload_fn: Callable[[], UploadResult],
 class ProgressFileReader:
     """Wraps a file object to report read progress via callback.
 
+    http.client asks for 8-16 KB per read(); small hints are raised to
+    READ_CHUNK so a multi-hundred-MB video takes a few hundred reads and
+    progress callbacks instead of tens of thousands. Content-Length still
+    comes from __len__, so the body is not sent chunked.
+
     Usage with requests:
         with open(path, "rb") as f:
             wrapped = ProgressFileReader(f, file_size, callback)
             requests.put(url, data=wrapped)
     """
 
+    READ_CHUNK = 1 << 20  # 1 MiB
+
     def __init__(self, file_obj, total_size: int,
                  callback: Optional[Callable[[float], None]] = None):
         self._file = file_obj
@@ -121,6 +178,8 @@ class ProgressFileReader:
         self._callback = callback
 
     def read(self, size: int = -1) -> bytes:
+        if 0 < size < self.READ_CHUNK:
+            size = self.READ_CHUNK
         data = self._file.read(size)
         if data:
             self._read_so_far += len(data)
@@ -132,22 +191,37 @@ class ProgressFileReader:
         return self._total
 
 
+def video_file_size(path: str) -> Optional[int]:
+    """Size in bytes from a single stat() — None if the file is missing."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+
 def get_output_videos(outputs_folder: str = "./outputs") -> list[dict]:
     """Scan outputs folder for completed .mp4 videos (newest first)."""
     videos = []
-    if not os.path.isdir(outputs_folder):
+    try:
+        it = os.scandir(outputs_folder)
+    except OSError:  # missing folder (or not a folder)
         return videos
-    for fname in os.listdir(outputs_folder):
-        if fname.lower().endswith(".mp4"):
-            fpath = os.path.join(outputs_folder, fname)
-            stat = os.stat(fpath)
-            size_mb = stat.st_size / (1024 * 1024)
+    # DirEntry carries name/path and caches stat() — one readdir, no per-file join
+    with it:
+        for entry in it:
+            fname = entry.name
+            if not fname.lower().endswith(".mp4") or not entry.is_file():
+                continue
+            stat = entry.stat()
             mtime = stat.st_mtime
             videos.append({
                 "filename": fname,
-                "path": fpath,
-                "size_mb": round(size_mb, 2),
-                "title": fname.replace("_short.mp4", "").replace("_", " "),
+                "path": entry.path,
+                "size_mb": round(stat.st_size / (1024 * 1024), 2),
+                "title": fname.removesuffix("_short.mp4").translate(_UNDERSCORE_TO_SPACE),
                 "mtime": mtime,
                 "date": time.strftime("%Y-%m-%d %H:%M", time.localtime(mtime)),
             })
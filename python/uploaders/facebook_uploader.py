@@ -12,19 +12,24 @@ Setup:
    - Page ID เป็น optional (ถ้าไม่ใส่จะใช้ "me" = โปรไฟล์ส่วนตัว)
 """
 
-import os
 import time
 import logging
 from typing import Optional, Callable
 
 import requests
 
-from . import UploadResult, UploadStatus, UploadRequest, ProgressFileReader
+from . import (UploadResult, UploadStatus, UploadRequest, ProgressFileReader,
+               render_hashtags, video_file_size)
+from ..http_session import make_session
 
 logger = logging.getLogger(__name__)
 
 GRAPH_API_BASE = "https://graph.facebook.com/v21.0"
 
+# Keep-alive pool shared by every FacebookUploader (the GUI makes one per upload):
+# token check, init, upload and finish reuse the same TLS connections
+_SESSION = make_session(pool_maxsize=4)
+
 
 class FacebookUploader:
     def __init__(self, page_id: str = "", access_token: str = ""):
@@ -39,7 +44,7 @@ class FacebookUploader:
         if not self.is_configured():
             return False
         try:
-            resp = requests.get(
+            resp = _SESSION.get(
                 f"{GRAPH_API_BASE}/{self.page_id}",
                 params={"access_token": self.access_token, "fields": "name"},
                 timeout=10,
@@ -56,28 +61,29 @@ class FacebookUploader:
                 platform="Facebook",
                 status=UploadStatus.FAILED,
                 error="ยังไม่ได้ตั้งค่า Access Token",
+                retryable=False,
             )
 
-        if not os.path.exists(request.video_path):
+        file_size = video_file_size(request.video_path)
+        if file_size is None:
             return UploadResult(
                 platform="Facebook",
                 status=UploadStatus.FAILED,
                 error=f"ไม่พบไฟล์วิดีโอ: {request.video_path}",
+                retryable=False,
             )
 
-        file_size = os.path.getsize(request.video_path)
-
         # Build description with hashtags
         description = request.title
         if request.description:
             description = f"{request.title}\n{request.description}"
         if request.tags:
-            description += "\n" + " ".join(f"#{t}" for t in request.tags)
+            description += "\n" + render_hashtags(request.tags)
 
         # Step 1: Initialize upload session
         try:
             logger.info(f"Facebook: เริ่มอัปโหลด '{request.title}'...")
-            init_resp = requests.post(
+            init_resp = _SESSION.post(
                 f"{GRAPH_API_BASE}/{self.page_id}/video_reels",
                 params={"access_token": self.access_token},
                 json={
@@ -115,7 +121,7 @@ class FacebookUploader:
         try:
             with open(request.video_path, "rb") as f:
                 wrapped = ProgressFileReader(f, file_size, progress_callback)
-                upload_resp = requests.post(
+                upload_resp = _SESSION.post(
                     upload_url,
                     headers={
                         "Authorization": f"OAuth {self.access_token}",
@@ -160,7 +166,7 @@ class FacebookUploader:
                 dt = _dt.fromisoformat(request.publish_at)
                 finish_body["scheduled_publish_time"] = int(dt.timestamp())
 
-            finish_resp = requests.post(
+            finish_resp = _SESSION.post(
                 f"{GRAPH_API_BASE}/{self.page_id}/video_reels",
                 params={"access_token": self.access_token},
                 json=finish_body,
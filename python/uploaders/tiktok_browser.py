@@ -12,17 +12,47 @@ Language: Force English via browser preferences + URL param
 
 import os
 import json
+import calendar
 import time
+import shutil
+import functools
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Callable
 from pathlib import Path
 
-from . import UploadResult, UploadStatus, UploadRequest
+from . import UploadResult, UploadStatus, UploadRequest, render_hashtags
+
+# Optional: orjson parses the cookie file bytes directly (stdlib json fallback;
+# orjson.JSONDecodeError subclasses json.JSONDecodeError)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Optional: selenium is only needed once a browser opens — every flow goes
+# through _create_edge_driver, which raises the install hint if it's missing
+try:
+    from selenium import webdriver
+    from selenium.webdriver.edge.options import Options as EdgeOptions
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.common.action_chains import ActionChains
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+except ImportError:
+    webdriver = EdgeOptions = By = Keys = ActionChains = WebDriverWait = EC = None
+
+# Optional: ciso8601's C parser for publish_at (also accepts a trailing "Z")
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
 
 logger = logging.getLogger(__name__)
 
 COOKIE_FILE = "tiktok_cookies.json"
+PROFILE_SEEDED_MARKER = ".h2s_session_ok"  # inside the Edge profile dir
 TIKTOK_DOMAIN = "https://www.tiktok.com"
 TIKTOK_UPLOAD_URL = f"{TIKTOK_DOMAIN}/upload?lang=en"
 TIKTOK_LOGIN_URL = f"{TIKTOK_DOMAIN}/login?lang=en"
@@ -56,28 +86,81 @@ _EMOJI_KEYWORDS = {
 }
 
 
+# Optional: pyahocorasick finds every keyword in one pass over the title
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _build_emoji_automaton():
+    """keyword → (table position, emoji) so matches can be ranked like the dict scan"""
+    automaton = ahocorasick.Automaton()
+    for rank, (keyword, emoji) in enumerate(_EMOJI_KEYWORDS.items()):
+        automaton.add_word(keyword, (rank, emoji))
+    automaton.make_automaton()
+    return automaton
+
+
+_EMOJI_AC = _build_emoji_automaton() if ahocorasick is not None else None
+
+
+@functools.lru_cache(maxsize=1024)
 def _pick_emoji(title: str) -> str:
     """Pick 1-2 relevant emojis based on title keywords."""
     title_lower = title.lower()
+    if _EMOJI_AC is not None:
+        # Matches arrive in title order — rank by table order to pick the same emojis
+        ranked = sorted(set(hit for _, hit in _EMOJI_AC.iter(title_lower)))
+        candidates = (emoji for _, emoji in ranked)
+    else:
+        candidates = (emoji for keyword, emoji in _EMOJI_KEYWORDS.items()
+                      if keyword in title_lower)
     found = []
-    for keyword, emoji in _EMOJI_KEYWORDS.items():
-        if keyword in title_lower and emoji not in found:
+    for emoji in candidates:
+        if emoji not in found:
             found.append(emoji)
             if len(found) >= 2:
                 break
     return "".join(found) if found else "\ud83c\udfb5"  # default: music note
 
 
-def _create_edge_driver(headless: bool = False):
+def _open_upload_page(driver):
+    """Load the upload page and wait for its form — or the redirect to /login."""
+    driver.get(TIKTOK_UPLOAD_URL)
+    # Wait for page to be interactive (not just loaded)
+    WebDriverWait(driver, 15, poll_frequency=_FAST_POLL).until(_page_loaded)
+    _wait_until(driver, lambda d: "/login" in d.current_url or d.find_elements(
+        By.CSS_SELECTOR, 'input[type="file"]'))
+
+
+def _profile_dir_for(cookie_path: str) -> str:
+    """Persistent Edge profile that sits next to its cookie file (one per account)."""
+    path = Path(cookie_path).resolve()
+    return str(path.with_name(f"{path.stem}_edge_profile"))
+
+
+# Runs before any page script; observes `document` since <html> may not exist yet
+_JOYRIDE_OBSERVER_JS = """
+    new MutationObserver(function () {
+        document.querySelectorAll('.react-joyride__overlay, .react-joyride').forEach(
+            function (el) { el.remove(); }
+        );
+    }).observe(document, {childList: true, subtree: true});
+"""
+
+
+def _create_edge_driver(headless: bool = False, profile_dir: Optional[str] = None):
     """Create Edge WebDriver with English language forced.
 
     Uses Selenium's built-in Selenium Manager to auto-find msedgedriver.
     No need for webdriver-manager package.
+
+    profile_dir: persistent --user-data-dir, so the session (cookies,
+    localStorage) survives between runs. None = throwaway temp profile.
+    One Edge instance per profile at a time.
     """
-    try:
-        from selenium import webdriver
-        from selenium.webdriver.edge.options import Options as EdgeOptions
-    except ImportError:
+    if webdriver is None:
         raise ImportError(
             "ต้องติดตั้ง: pip install selenium"
         )
@@ -96,6 +179,10 @@ def _create_edge_driver(headless: bool = False):
     options.add_argument("--no-default-browser-check")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
 
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+        options.add_argument("--profile-directory=Default")
+
     if headless:
         options.add_argument("--headless=new")
 
@@ -103,52 +190,167 @@ def _create_edge_driver(headless: bool = False):
     driver = webdriver.Edge(options=options)
     driver.set_window_size(1280, 900)
 
+    # Remove Joyride tutorial overlays the moment they're added, on every page
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                               {"source": _JOYRIDE_OBSERVER_JS})
+    except Exception:
+        pass  # _dismiss_overlays still removes them on demand
+
     return driver
 
 
 def _save_cookies(driver, cookie_path: str):
-    """Save all cookies from browser to JSON file."""
-    cookies = driver.get_cookies()
-    with open(cookie_path, "w", encoding="utf-8") as f:
-        json.dump(cookies, f, indent=2, ensure_ascii=False)
+    """Save unexpired cookies from browser to JSON file.
+
+    Skips the write when the file already holds the same bytes, and writes
+    via a temp file + os.replace so a crash never leaves half a cookie file.
+    """
+    now = time.time()
+    cookies = [c for c in driver.get_cookies()
+               if "expiry" not in c or c["expiry"] >= now]
+    payload = json.dumps(cookies, ensure_ascii=False,
+                         separators=(",", ":")).encode("utf-8")
+
+    try:
+        with open(cookie_path, "rb") as f:
+            unchanged = f.read() == payload
+    except OSError:
+        unchanged = False
+    if unchanged:
+        logger.debug("TikTok: cookie ไม่เปลี่ยน — ข้ามการบันทึก")
+        return
+
+    tmp_path = cookie_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, cookie_path)
     logger.info(f"TikTok: บันทึก cookie แล้ว ({len(cookies)} cookies)")
 
 
+# Fields Selenium's add_cookie rejects or mishandles
+_DROP_COOKIE_FIELDS = frozenset(("sameSite", "httpOnly", "storeId"))
+
+
+def _set_cookies_cdp(driver, cookies: list) -> bool:
+    """Set all cookies with one CDP Network.setCookies call (Edge is Chromium).
+
+    Returns False if CDP is unavailable or rejects the batch, so the caller
+    can fall back to per-cookie add_cookie.
+    """
+    if not cookies:
+        return False
+    cdp_cookies = []
+    for c in cookies:
+        cdp = {
+            "name": c["name"],
+            "value": c["value"],
+            "domain": c.get("domain", ".tiktok.com"),
+            "path": c.get("path", "/"),
+            "secure": c.get("secure", False),
+            "httpOnly": c.get("httpOnly", False),
+        }
+        if "expiry" in c:
+            cdp["expires"] = c["expiry"]  # omitted = session cookie
+        cdp_cookies.append(cdp)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
+        return True
+    except Exception as e:
+        logger.debug(f"TikTok: CDP setCookies ไม่ได้ — {e} — ใช้ add_cookie แทน")
+        return False
+
+
 def _load_cookies(driver, cookie_path: str) -> bool:
     """Load cookies from JSON file into browser. Returns True if loaded."""
     if not os.path.exists(cookie_path):
         return False
 
     try:
-        with open(cookie_path, "r", encoding="utf-8") as f:
-            cookies = json.load(f)
-    except (json.JSONDecodeError, IOError):
+        cookies = _json_loads(Path(cookie_path).read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
         logger.warning("TikTok: cookie file corrupted")
         return False
 
-    # Navigate to TikTok domain first (required before setting cookies)
-    driver.get(TIKTOK_DOMAIN + "?lang=en")
-    time.sleep(2)
-
+    # Skip expired cookies
     now = time.time()
-    loaded = 0
-    for cookie in cookies:
-        # Skip expired cookies
-        if "expiry" in cookie and cookie["expiry"] < now:
-            continue
-        # Some cookie fields cause issues — clean up
-        for key in ["sameSite", "httpOnly", "storeId"]:
-            cookie.pop(key, None)
-        try:
-            driver.add_cookie(cookie)
-            loaded += 1
-        except Exception:
-            pass  # Skip problematic cookies
+    fresh = [c for c in cookies if "expiry" not in c or c["expiry"] >= now]
+
+    # CDP sets cookies for any domain without loading a page first —
+    # the caller's own navigation to the upload page then carries them
+    if _set_cookies_cdp(driver, fresh):
+        loaded = len(fresh)
+    else:
+        # add_cookie only works for the current page's domain
+        driver.get(TIKTOK_DOMAIN + "?lang=en")
+        _wait_until(driver, _page_loaded, timeout=5)
+
+        # One WebDriver command per cookie
+        loaded = 0
+        for cookie in fresh:
+            # Some cookie fields cause issues — clean up
+            cookie = {k: v for k, v in cookie.items() if k not in _DROP_COOKIE_FIELDS}
+            try:
+                driver.add_cookie(cookie)
+                loaded += 1
+            except Exception:
+                pass  # Skip problematic cookies
 
     logger.info(f"TikTok: โหลด {loaded}/{len(cookies)} cookies")
     return loaded > 0
 
 
+# WebDriverWait polls every 0.5 s by default — too coarse for UI transitions
+_FAST_POLL = 0.1
+
+
+def _wait_until(driver, condition, timeout: float = 10):
+    """WebDriverWait(...).until with a 100 ms poll; returns None on timeout
+    instead of raising, for waits that only replace a fixed sleep."""
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=_FAST_POLL).until(condition)
+    except Exception:
+        return None
+
+
+def _page_loaded(driver) -> bool:
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+def _poll_js(driver, script: str, *args, timeout: float = 5, interval: float = 0.1):
+    """Run a JS predicate every `interval` seconds until it returns truthy.
+
+    Returns the last result — falsy means the timeout was hit. Replaces
+    fixed sleeps with a wait that ends as soon as the DOM has caught up.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        result = driver.execute_script(script, *args)
+        if result or time.monotonic() >= deadline:
+            return result
+        time.sleep(interval)
+
+
+# Resolve with the caption length once it reaches arguments[1] chars, or after
+# arguments[2] ms. Watches DOM mutations, so it reacts the instant DraftEditor
+# re-renders — and checks first, in case the paste already landed.
+_AWAIT_CAPTION_JS = """
+    var el = arguments[0], target = arguments[1], done = arguments[arguments.length - 1];
+    var finish = function () {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(el.textContent.trim().length);
+    };
+    var observer = new MutationObserver(function () {
+        if (el.textContent.length >= target) finish();
+    });
+    var timer = setTimeout(finish, arguments[2]);
+    if (el.textContent.length >= target) { finish(); return; }
+    observer.observe(el, {childList: true, characterData: true, subtree: true});
+"""
+
+
 def _fill_caption(driver, element, text: str):
     """Fill TikTok's DraftEditor caption field reliably using clipboard paste.
 
@@ -156,31 +358,26 @@ def _fill_caption(driver, element, text: str):
     document.execCommand('insertText'). Clipboard paste (Ctrl+V) works
     because DraftEditor handles paste events natively.
     """
-    from selenium.webdriver.common.keys import Keys
-    from selenium.webdriver.common.action_chains import ActionChains
+
+    is_focused = "return document.activeElement === arguments[0] || arguments[0].contains(document.activeElement);"
+    is_empty = "return arguments[0].textContent.trim().length === 0;"
 
     # Step 1: Click to focus
     driver.execute_script("arguments[0].click();", element)
-    time.sleep(1)
+    _poll_js(driver, is_focused, element, timeout=1)
 
     # Step 2: Select all existing text (Ctrl+A) and delete
     actions = ActionChains(driver)
     actions.click(element).perform()
-    time.sleep(0.5)
     actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
-    time.sleep(0.5)
     actions.send_keys(Keys.BACKSPACE).perform()
-    time.sleep(1)
 
     # Step 3: Double check it's cleared
-    remaining = driver.execute_script(
-        "return arguments[0].textContent.trim().length;", element)
-    if remaining > 0:
+    if not _poll_js(driver, is_empty, element, timeout=1):
         # More aggressive clear
         actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
-        time.sleep(0.3)
         actions.send_keys(Keys.DELETE).perform()
-        time.sleep(0.5)
+        _poll_js(driver, is_empty, element, timeout=1)
 
     # Step 4: Paste caption via clipboard (Ctrl+V)
     # Use JS to set clipboard, then Ctrl+V to paste into DraftEditor
@@ -188,24 +385,23 @@ def _fill_caption(driver, element, text: str):
         // Write text to clipboard via Clipboard API
         navigator.clipboard.writeText(arguments[0]).catch(function() {});
     """, text)
-    time.sleep(0.5)
 
     # Focus element and paste
     actions = ActionChains(driver)
     actions.click(element).perform()
-    time.sleep(0.3)
     actions.key_down(Keys.CONTROL).send_keys("v").key_up(Keys.CONTROL).perform()
-    time.sleep(1)
 
-    # Step 5: Verify — if clipboard paste didn't work, fall back to send_keys
-    actual_len = driver.execute_script(
-        "return arguments[0].textContent.trim().length;", element)
+    # Step 5: Verify — the browser waits for ~90% of the text to land
+    # (DraftEditor drops block newlines); if paste didn't work at all,
+    # fall back to send_keys
+    actual_len = driver.execute_async_script(
+        _AWAIT_CAPTION_JS, element, int(len(text) * 0.9), 1500)
     if actual_len < 5:
         logger.warning("TikTok: clipboard paste ไม่ทำงาน — ลอง send_keys")
         actions.click(element).perform()
-        time.sleep(0.3)
         element.send_keys(text)
-        time.sleep(1)
+        _poll_js(driver, "return arguments[0].textContent.trim().length > 0;",
+                 element, timeout=5)
 
 
 def _dismiss_overlays(driver):
@@ -213,6 +409,8 @@ def _dismiss_overlays(driver):
 
     TikTok shows a react-joyride tutorial overlay that blocks clicks.
     This removes them via JS so real elements become clickable.
+    Joyride is normally gone already (_JOYRIDE_OBSERVER_JS); closing modal
+    buttons stays an explicit step so it never fires mid-confirm-dialog.
     """
     try:
         driver.execute_script("""
@@ -250,6 +448,75 @@ def _dismiss_overlays(driver):
         pass  # Best effort — don't fail if overlay dismissal fails
 
 
+# Lowercase success phrases — one innerText scan per poll covers them all
+# ("your video is being uploaded" ⊃ "uploaded", "video is scheduled" ⊃ "scheduled")
+_SUCCESS_SIGNALS = (
+    "uploaded", "manage your posts", "upload another", "successfully",
+    "video is live", "being processed", "your video has been",
+    "scheduled", "will be posted",
+)
+
+# One round-trip per poll: every readiness/success signal the waiters need.
+# el.text in Selenium is '' for hidden elements — mirrored via getClientRects().
+_PAGE_STATUS_JS = """
+    var visibleText = function (el) {
+        return el.getClientRects().length ? (el.innerText || '').toLowerCase() : '';
+    };
+    var processing = Array.prototype.some.call(document.querySelectorAll(
+        '[class*="progress"], [class*="uploading"], [class*="processing"], [class*="loading"]'
+    ), function (el) {
+        var text = visibleText(el);
+        return ['uploading', 'processing', 'loading'].some(function (w) {
+            return text.indexOf(w) !== -1;
+        }) || String(window.getComputedStyle(el).width).indexOf('%') !== -1;
+    });
+
+    var postBtn = document.querySelector(
+        'button[data-e2e="post_video_button"], button[data-e2e="post-button"], ' +
+        'button[data-e2e="publish_button"]');
+    if (!postBtn) {
+        postBtn = Array.prototype.find.call(document.querySelectorAll('button'), function (b) {
+            var text = (b.textContent || '').trim().toLowerCase();
+            return text === 'post' || text === 'publish';
+        }) || null;
+    }
+    var postEnabled = null;
+    if (postBtn) {
+        postEnabled = !postBtn.disabled
+            && postBtn.getAttribute('aria-disabled') !== 'true'
+            && (postBtn.getAttribute('class') || '').indexOf('disabled') === -1;
+    }
+
+    var body = document.body ? document.body.innerText.toLowerCase() : '';
+    var signals = arguments[0];
+    return {
+        processing: processing,
+        post_video_button: !!document.querySelector('button[data-e2e="post_video_button"]'),
+        post_enabled: postEnabled,
+        editor: !!document.querySelector('div[contenteditable="true"]'),
+        success: signals.some(function (s) { return body.indexOf(s) !== -1; }),
+        url: window.location.href
+    };
+"""
+
+
+def _page_status(driver) -> dict:
+    """Snapshot of the upload page in a single execute_script call."""
+    return driver.execute_script(_PAGE_STATUS_JS, list(_SUCCESS_SIGNALS))
+
+
+# Waiter poll intervals (seconds): quick checks first for short clips,
+# then settle at the old fixed 3 s
+_POLL_BACKOFF = (0.5, 0.5, 1, 1, 2, 3)
+
+
+def _poll_delays():
+    """Yield _POLL_BACKOFF, then its last value forever."""
+    yield from _POLL_BACKOFF
+    while True:
+        yield _POLL_BACKOFF[-1]
+
+
 def _wait_for_video_ready(driver, timeout: int = 120):
     """Wait for TikTok to finish processing the uploaded video file.
 
@@ -260,52 +527,29 @@ def _wait_for_video_ready(driver, timeout: int = 120):
 
     Falls back to a minimum fixed wait if none of the signals are detected.
     """
-    from selenium.webdriver.common.by import By
-
     start = time.time()
     min_wait = 5  # Always wait at least this long
-    poll_interval = 2
+    delays = _poll_delays()
 
     time.sleep(min_wait)
 
     while time.time() - start < timeout:
         try:
-            # Check if a progress/processing indicator is still visible
-            processing_indicators = driver.find_elements(By.CSS_SELECTOR, (
-                '[class*="progress"], [class*="uploading"], '
-                '[class*="processing"], [class*="loading"]'
-            ))
-            still_processing = False
-            for el in processing_indicators:
-                text = (el.text or "").lower()
-                if any(w in text for w in ["uploading", "processing", "loading"]):
-                    still_processing = True
-                    break
-                # Check for progress bar that's not at 100%
-                width = el.value_of_css_property("width")
-                if width and "%" in str(width):
-                    still_processing = True
-                    break
-
-            if not still_processing:
-                # Also check for the post button as a readiness signal
-                post_btns = driver.find_elements(
-                    By.CSS_SELECTOR, 'button[data-e2e="post_video_button"]')
-                if post_btns:
-                    logger.info("TikTok: วิดีโอประมวลผลเสร็จแล้ว")
-                    return
+            status = _page_status(driver)
+            # Post button as a readiness signal once nothing is still processing
+            if not status["processing"] and status["post_video_button"]:
+                logger.info("TikTok: วิดีโอประมวลผลเสร็จแล้ว")
+                return
 
             # Check if caption editor is available (another readiness signal)
-            editors = driver.find_elements(
-                By.CSS_SELECTOR, 'div[contenteditable="true"]')
-            if editors and len(editors) > 0:
+            if status["editor"]:
                 logger.info("TikTok: caption editor พร้อมแล้ว")
                 return
 
         except Exception:
             pass
 
-        time.sleep(poll_interval)
+        time.sleep(next(delays))
 
     logger.info("TikTok: timeout รอวิดีโอ — ดำเนินการต่อ")
 
@@ -316,94 +560,107 @@ def _wait_for_post_ready(driver, timeout: int = 120):
     TikTok disables the Post button while video is still processing.
     This waits until it becomes clickable.
     """
-    from selenium.webdriver.common.by import By
-
     start = time.time()
-    poll_interval = 3
+    delays = _poll_delays()
     time.sleep(3)  # Initial settle
 
     while time.time() - start < timeout:
         try:
-            btn = _find_post_button(driver, timeout=5)
-            if btn:
-                # Check if button is enabled
-                is_disabled = btn.get_attribute("disabled")
-                aria_disabled = btn.get_attribute("aria-disabled")
-                classes = btn.get_attribute("class") or ""
-                if (not is_disabled and aria_disabled != "true"
-                        and "disabled" not in classes):
-                    logger.info("TikTok: ปุ่ม Post พร้อมกดแล้ว")
-                    return
+            enabled = _page_status(driver)["post_enabled"]
+            if enabled is None:
+                # Not found by data-e2e/text — try the slower XPath strategies
+                btn = _find_post_button(driver, timeout=5)
+                if btn:
+                    classes = btn.get_attribute("class") or ""
+                    enabled = (not btn.get_attribute("disabled")
+                               and btn.get_attribute("aria-disabled") != "true"
+                               and "disabled" not in classes)
+            if enabled:
+                logger.info("TikTok: ปุ่ม Post พร้อมกดแล้ว")
+                return
+            if enabled is not None:
                 logger.debug("TikTok: ปุ่ม Post ยัง disabled อยู่ — รอต่อ...")
         except Exception:
             pass
-        time.sleep(poll_interval)
+        time.sleep(next(delays))
 
     logger.warning("TikTok: timeout รอปุ่ม Post — ลองกดเลย")
 
 
+# Selector lists in priority order — each list is probed with a single wait
+_POST_BUTTON_CSS = (
+    'button[data-e2e="post_video_button"]',
+    'button[data-e2e="post-button"]',
+    'button[data-e2e="publish_button"]',
+)
+_POST_BUTTON_WORDS = ("post", "publish")
+_POST_BUTTON_CONTAINERS = ('div[class*="btn-post"] button', 'div[class*="post"] button')
+_SCHEDULE_BUTTON_CSS = (
+    'button[data-e2e="post_video_button"]',
+    'button[data-e2e="schedule_button"]',
+    'button[data-e2e="post-button"]',
+)
+_SCHEDULE_BUTTON_WORDS = ("schedule", "post")
+
+# First button whose text contains words[0], else words[1], ...; then the
+# first button inside a matching container. querySelectorAll + a text filter
+# runs natively — Blink's XPath contains(text()) walks the whole tree per query.
+_FIND_BUTTON_JS = """
+    var words = arguments[0], containers = arguments[1];
+    var buttons = Array.prototype.slice.call(document.querySelectorAll('button'));
+    for (var i = 0; i < words.length; i++) {
+        var hit = buttons.find(function (b) {
+            return (b.textContent || '').toLowerCase().indexOf(words[i]) !== -1;
+        });
+        if (hit) return hit;
+    }
+    for (var j = 0; j < containers.length; j++) {
+        var el = document.querySelector(containers[j]);
+        if (el) return el;
+    }
+    return null;
+"""
+
+
+def _find_first(driver, by, selectors, timeout: float):
+    """Wait once for any of `selectors` to match, then return the
+    highest-priority match (or None if nothing appears within timeout)."""
+
+    union = (", " if by == By.CSS_SELECTOR else " | ").join(selectors)
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((by, union)))
+    except Exception:
+        return None
+    for selector in selectors:
+        found = driver.find_elements(by, selector)
+        if found:
+            return found[0]
+    return None
+
+
+def _find_button_by_text(driver, words, containers=(), timeout: float = 5):
+    """Poll _FIND_BUTTON_JS until a button turns up — one round-trip per poll."""
+    try:
+        return _poll_js(driver, _FIND_BUTTON_JS, list(words), list(containers),
+                        timeout=timeout, interval=0.25) or None
+    except Exception:
+        return None
+
+
 def _find_post_button(driver, timeout: int = 30):
     """Find the Post/Publish button using multiple selector strategies.
 
     Returns the button element or None.
     """
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.common.by import By
 
     # Strategy 1: data-e2e attribute (most stable)
-    css_selectors = [
-        'button[data-e2e="post_video_button"]',
-        'button[data-e2e="post-button"]',
-        'button[data-e2e="publish_button"]',
-    ]
-    for selector in css_selectors:
-        try:
-            btn = WebDriverWait(driver, min(timeout, 10)).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-            )
-            if btn:
-                return btn
-        except Exception:
-            continue
-
-    # Strategy 2: XPath text matching (English UI)
-    xpath_selectors = [
-        '//button[contains(text(), "Post")]',
-        '//button[contains(text(), "post")]',
-        '//button[contains(text(), "Publish")]',
-        '//button[contains(text(), "publish")]',
-        '//div[contains(@class, "btn-post")]//button',
-        '//div[contains(@class, "post")]//button',
-    ]
-    for xpath in xpath_selectors:
-        try:
-            btn = WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.XPATH, xpath))
-            )
-            if btn:
-                return btn
-        except Exception:
-            continue
-
-    # Strategy 3: JS-based search for button with "Post" text
-    try:
-        btn = driver.execute_script("""
-            var buttons = document.querySelectorAll('button');
-            for (var i = 0; i < buttons.length; i++) {
-                var text = (buttons[i].textContent || '').trim().toLowerCase();
-                if (text === 'post' || text === 'publish') {
-                    return buttons[i];
-                }
-            }
-            return null;
-        """)
-        if btn:
-            return btn
-    except Exception:
-        pass
+    btn = _find_first(driver, By.CSS_SELECTOR, _POST_BUTTON_CSS, min(timeout, 10))
+    if btn:
+        return btn
 
-    return None
+    # Strategy 2: button text (English UI), then post-ish containers
+    return _find_button_by_text(driver, _POST_BUTTON_WORDS, _POST_BUTTON_CONTAINERS)
 
 
 def _find_schedule_button(driver, timeout: int = 30):
@@ -411,61 +668,14 @@ def _find_schedule_button(driver, timeout: int = 30):
 
     Returns the button element or None.
     """
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.common.by import By
 
     # Strategy 1: data-e2e attribute
-    css_selectors = [
-        'button[data-e2e="post_video_button"]',
-        'button[data-e2e="schedule_button"]',
-        'button[data-e2e="post-button"]',
-    ]
-    for selector in css_selectors:
-        try:
-            btn = WebDriverWait(driver, min(timeout, 10)).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-            )
-            if btn:
-                return btn
-        except Exception:
-            continue
-
-    # Strategy 2: XPath text matching
-    xpath_selectors = [
-        '//button[contains(text(), "Schedule")]',
-        '//button[contains(text(), "schedule")]',
-        '//button[.//div[text()="Schedule"]]',
-        '//button[contains(text(), "Post")]',
-    ]
-    for xpath in xpath_selectors:
-        try:
-            btn = WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.XPATH, xpath))
-            )
-            if btn:
-                return btn
-        except Exception:
-            continue
-
-    # Strategy 3: JS-based search
-    try:
-        btn = driver.execute_script("""
-            var buttons = document.querySelectorAll('button');
-            for (var i = 0; i < buttons.length; i++) {
-                var text = (buttons[i].textContent || '').trim().toLowerCase();
-                if (text === 'schedule' || text === 'post') {
-                    return buttons[i];
-                }
-            }
-            return null;
-        """)
-        if btn:
-            return btn
-    except Exception:
-        pass
+    btn = _find_first(driver, By.CSS_SELECTOR, _SCHEDULE_BUTTON_CSS, min(timeout, 10))
+    if btn:
+        return btn
 
-    return None
+    # Strategy 2: button text
+    return _find_button_by_text(driver, _SCHEDULE_BUTTON_WORDS)
 
 
 def _wait_for_upload_success(driver, timeout: int = 60) -> bool:
@@ -474,66 +684,25 @@ def _wait_for_upload_success(driver, timeout: int = 60) -> bool:
     Checks multiple signals: success text, URL change, "upload another" button.
     Returns True if success was detected, False otherwise.
     """
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.common.by import By
-
-    success_xpaths = [
-        '//*[contains(text(), "uploaded")]',
-        '//*[contains(text(), "Your video is being uploaded")]',
-        '//*[contains(text(), "being processed")]',
-        '//*[contains(text(), "successfully")]',
-        '//*[contains(text(), "Manage your posts")]',
-        '//*[contains(text(), "Upload another")]',
-        '//*[contains(text(), "upload another")]',
-        '//*[contains(text(), "Your video has been")]',
-        '//*[contains(text(), "video is live")]',
-        '//*[contains(text(), "scheduled")]',
-        '//*[contains(text(), "will be posted")]',
-        '//*[contains(text(), "video is scheduled")]',
-    ]
-
     start = time.time()
-    poll_interval = 3
+    delays = _poll_delays()
 
     while time.time() - start < timeout:
-        # Check text-based signals
-        for xpath in success_xpaths:
-            try:
-                elements = driver.find_elements(By.XPATH, xpath)
-                if elements:
-                    logger.info("TikTok: ตรวจพบข้อความสำเร็จ")
-                    return True
-            except Exception:
-                continue
-
-        # Check URL change (redirect away from upload page = likely success)
         try:
-            current_url = driver.current_url
-            if "/upload" not in current_url and "tiktok.com" in current_url:
-                logger.info("TikTok: redirect จากหน้า upload — น่าจะสำเร็จ")
+            status = _page_status(driver)
+            if status["success"]:
+                logger.info("TikTok: ตรวจพบข้อความสำเร็จ")
                 return True
-        except Exception:
-            pass
 
-        # Check via JS for any success-related elements
-        try:
-            found = driver.execute_script("""
-                var body = document.body.innerText.toLowerCase();
-                var signals = ['uploaded', 'manage your posts', 'upload another',
-                               'successfully', 'video is live', 'being processed',
-                               'scheduled', 'will be posted', 'video is scheduled'];
-                for (var i = 0; i < signals.length; i++) {
-                    if (body.indexOf(signals[i]) !== -1) return true;
-                }
-                return false;
-            """)
-            if found:
-                logger.info("TikTok: JS ตรวจพบสัญญาณสำเร็จ")
+            # Redirect away from upload page = likely success
+            current_url = status["url"]
+            if "/upload" not in current_url and "tiktok.com" in current_url:
+                logger.info("TikTok: redirect จากหน้า upload — น่าจะสำเร็จ")
                 return True
         except Exception:
             pass
 
-        time.sleep(poll_interval)
+        time.sleep(next(delays))
 
     logger.warning("TikTok: ไม่พบสัญญาณสำเร็จชัดเจน — ถือว่าสำเร็จ (best-effort)")
     return False
@@ -573,6 +742,9 @@ _SCHED_SELECTORS = {
     "time_picker_text": "//div[contains(@class, 'time-picker-input')]/*[1]",
 }
 
+# Every switch selector in one XPath union, built once
+_SCHED_SWITCH_UNION_XPATH = " | ".join(_SCHED_SELECTORS["switch"])
+
 
 def validate_tiktok_schedule(publish_at_iso: str) -> datetime:
     """Validate and adjust a publish_at ISO string for TikTok's constraints.
@@ -580,7 +752,7 @@ def validate_tiktok_schedule(publish_at_iso: str) -> datetime:
     Returns a timezone-aware datetime rounded to the nearest 5-minute multiple.
     Raises ValueError if the time is out of TikTok's allowed range.
     """
-    dt = datetime.fromisoformat(publish_at_iso)
+    dt = _parse_iso(publish_at_iso)
     if dt.tzinfo is None:
         # Assume ICT (UTC+7) if no timezone
         ict = timezone(timedelta(hours=7))
@@ -615,9 +787,6 @@ def _set_schedule_video(driver, schedule_dt: datetime):
         driver: Selenium WebDriver
         schedule_dt: timezone-aware datetime (already validated & rounded)
     """
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
 
     # Get browser timezone and convert schedule to it
     browser_tz_name = driver.execute_script(
@@ -640,40 +809,34 @@ def _set_schedule_video(driver, schedule_dt: datetime):
     logger.info(f"TikTok: ตั้งเวลา {local_dt.strftime('%Y-%m-%d %H:%M')} "
                 f"(tz: {browser_tz_name})")
 
+    # Each step waits for the elements it needs, so no settle sleeps between them
     # Step 1: Click schedule toggle/switch
     _click_schedule_switch(driver)
-    time.sleep(1)
 
     # Step 2: Set date
     _pick_schedule_date(driver, target_month, target_day)
-    time.sleep(0.5)
 
     # Step 3: Set time
     _pick_schedule_time(driver, target_hour, target_minute)
-    time.sleep(0.5)
 
     logger.info("TikTok: ตั้งเวลาสำเร็จ")
 
 
 def _click_schedule_switch(driver):
     """Click the schedule toggle switch using multiple selector strategies."""
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
 
-    selectors = _SCHED_SELECTORS["switch"]
-    for xpath in selectors:
-        try:
-            el = WebDriverWait(driver, 5).until(
-                lambda d, x=xpath: d.find_element(By.XPATH, x)
-            )
-            if el and el.is_displayed():
+    # The upload form is already rendered here — one immediate query over all
+    # switch selectors instead of a 5 s wait per selector
+    try:
+        for el in driver.find_elements(By.XPATH, _SCHED_SWITCH_UNION_XPATH):
+            if el.is_displayed():
                 driver.execute_script("arguments[0].scrollIntoView(true);", el)
-                time.sleep(0.3)
+                _wait_until(driver, EC.element_to_be_clickable(el), timeout=2)
                 driver.execute_script("arguments[0].click();", el)
-                logger.debug(f"TikTok: schedule switch clicked via: {xpath}")
+                logger.debug("TikTok: schedule switch clicked via XPath")
                 return
-        except Exception:
-            continue
+    except Exception:
+        pass
 
     # Fallback: JS search for any element with "Schedule" text
     clicked = driver.execute_script("""
@@ -697,32 +860,37 @@ def _click_schedule_switch(driver):
     raise Exception("TikTok: หาปุ่ม Schedule ไม่เจอ")
 
 
+# "march" / "mar" → 3 — same names strptime's %B / %b accept, built once
+_MONTHS = {calendar.month_name[i].lower(): i for i in range(1, 13)}
+_MONTHS.update({calendar.month_abbr[i].lower(): i for i in range(1, 13)})
+
+
+def _month_number(name: str) -> int:
+    """Month number from the calendar header ("March", "Mar", "March 2026")."""
+    month = _MONTHS.get(name.lower()) or _MONTHS.get(name[:3].lower())
+    if month is None:
+        raise ValueError(f"unknown month name: {name!r}")
+    return month
+
+
 def _pick_schedule_date(driver, month: int, day: int):
     """Navigate TikTok's calendar and select the target date."""
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
 
     # Click date picker to open calendar
-    date_picker = WebDriverWait(driver, 10).until(
+    date_picker = WebDriverWait(driver, 10, poll_frequency=_FAST_POLL).until(
         lambda d: d.find_element(By.XPATH, _SCHED_SELECTORS["date_picker"])
     )
     driver.execute_script("arguments[0].click();", date_picker)
-    time.sleep(1)
 
     # Wait for calendar to appear
-    WebDriverWait(driver, 10).until(
+    WebDriverWait(driver, 10, poll_frequency=_FAST_POLL).until(
         EC.visibility_of_element_located((By.XPATH, _SCHED_SELECTORS["calendar"]))
     )
 
     # Check current month and navigate if needed
     month_el = driver.find_element(By.XPATH, _SCHED_SELECTORS["calendar_month"])
-    current_month_name = month_el.text.strip()
-    try:
-        current_month = datetime.strptime(current_month_name, "%B").month
-    except ValueError:
-        # Try abbreviated month name
-        current_month = datetime.strptime(current_month_name[:3], "%b").month
+    month_name = month_el.text.strip()
+    current_month = _month_number(month_name)
 
     # Navigate months (forward or backward)
     max_nav = 12  # safety limit
@@ -734,47 +902,36 @@ def _pick_schedule_date(driver, month: int, day: int):
             driver.execute_script("arguments[0].click();", arrows[-1])  # next
         else:
             driver.execute_script("arguments[0].click();", arrows[0])  # prev
-        time.sleep(0.5)
+        # Wait for the header to show the new month
+        _wait_until(driver, lambda d, prev=month_name: d.find_element(
+            By.XPATH, _SCHED_SELECTORS["calendar_month"]).text.strip() != prev, timeout=3)
         month_el = driver.find_element(By.XPATH, _SCHED_SELECTORS["calendar_month"])
-        current_month_name = month_el.text.strip()
-        try:
-            current_month = datetime.strptime(current_month_name, "%B").month
-        except ValueError:
-            current_month = datetime.strptime(current_month_name[:3], "%b").month
+        month_name = month_el.text.strip()
+        current_month = _month_number(month_name)
         max_nav -= 1
 
-    # Click the target day
-    valid_days = driver.find_elements(
-        By.XPATH, _SCHED_SELECTORS["calendar_valid_days"])
-
-    clicked = False
-    for day_el in valid_days:
-        if day_el.text.strip() == str(day):
-            driver.execute_script("arguments[0].click();", day_el)
-            clicked = True
-            break
-
-    if not clicked:
+    # Click the target day — filtered by text in the XPath itself, so one
+    # query instead of a .text round-trip per day cell
+    day_els = driver.find_elements(
+        By.XPATH, f"{_SCHED_SELECTORS['calendar_valid_days']}[normalize-space(.)='{day}']")
+    if not day_els:
         raise Exception(f"TikTok: หาวันที่ {day} ไม่เจอในปฏิทิน")
+    driver.execute_script("arguments[0].click();", day_els[0])
 
     logger.debug(f"TikTok: เลือกวันที่ {month}/{day}")
 
 
 def _pick_schedule_time(driver, hour: int, minute: int):
     """Select hour and minute from TikTok's time picker."""
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
 
     # Click time picker to open dropdown
-    time_picker = WebDriverWait(driver, 10).until(
+    time_picker = WebDriverWait(driver, 10, poll_frequency=_FAST_POLL).until(
         lambda d: d.find_element(By.XPATH, _SCHED_SELECTORS["time_picker"])
     )
     driver.execute_script("arguments[0].click();", time_picker)
-    time.sleep(1)
 
     # Wait for time picker container
-    WebDriverWait(driver, 10).until(
+    WebDriverWait(driver, 10, poll_frequency=_FAST_POLL).until(
         EC.visibility_of_element_located((
             By.XPATH, _SCHED_SELECTORS["time_picker_container"]))
     )
@@ -786,29 +943,29 @@ def _pick_schedule_time(driver, hour: int, minute: int):
         target_hour = hour_options[hour]
         driver.execute_script(
             "arguments[0].scrollIntoView({block: 'center'});", target_hour)
-        time.sleep(0.3)
+        _wait_until(driver, EC.element_to_be_clickable(target_hour), timeout=2)
         driver.execute_script("arguments[0].click();", target_hour)
     else:
         raise Exception(f"TikTok: หาชั่วโมง {hour} ไม่เจอ (มี {len(hour_options)} ตัวเลือก)")
 
-    time.sleep(0.5)
-
     # Select minute (in multiples of 5, so index = minute / 5)
-    minute_options = driver.find_elements(
-        By.XPATH, _SCHED_SELECTORS["timepicker_minutes"])
+    minute_options = _wait_until(
+        driver, lambda d: d.find_elements(By.XPATH, _SCHED_SELECTORS["timepicker_minutes"]),
+        timeout=2) or []
     minute_idx = minute // TIKTOK_MINUTE_MULTIPLE
     if minute_idx < len(minute_options):
         target_minute = minute_options[minute_idx]
         driver.execute_script(
             "arguments[0].scrollIntoView({block: 'center'});", target_minute)
-        time.sleep(0.3)
+        _wait_until(driver, EC.element_to_be_clickable(target_minute), timeout=2)
         driver.execute_script("arguments[0].click();", target_minute)
     else:
         raise Exception(f"TikTok: หานาที {minute} ไม่เจอ (มี {len(minute_options)} ตัวเลือก)")
 
     # Close time picker by clicking it again
     driver.execute_script("arguments[0].click();", time_picker)
-    time.sleep(0.5)
+    _wait_until(driver, EC.invisibility_of_element_located((
+        By.XPATH, _SCHED_SELECTORS["time_picker_container"])), timeout=2)
 
     logger.debug(f"TikTok: เลือกเวลา {hour:02d}:{minute:02d}")
 
@@ -818,6 +975,7 @@ class TikTokBrowserUploader:
 
     def __init__(self, cookie_path: str = COOKIE_FILE):
         self.cookie_path = cookie_path
+        self.profile_dir = _profile_dir_for(cookie_path)
 
     def is_configured(self) -> bool:
         """Cookie file exists = configured."""
@@ -831,14 +989,10 @@ class TikTokBrowserUploader:
         driver = None
         try:
             logger.info("TikTok: เปิดเบราว์เซอร์เพื่อ login...")
-            driver = _create_edge_driver(headless=False)
+            driver = _create_edge_driver(headless=False, profile_dir=self.profile_dir)
             driver.get(TIKTOK_LOGIN_URL)
 
             # Wait for user to login — detect by checking for logged-in state
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.common.by import By
-
             logger.info("TikTok: กรุณา login ในเบราว์เซอร์ (รอ 5 นาที)...")
 
             # Wait until URL no longer contains /login OR a profile element appears
@@ -859,6 +1013,7 @@ class TikTokBrowserUploader:
             time.sleep(3)
 
             _save_cookies(driver, self.cookie_path)
+            self._mark_seeded()
             logger.info("TikTok: login สำเร็จ — cookie บันทึกแล้ว")
             return True
 
@@ -873,11 +1028,23 @@ class TikTokBrowserUploader:
                 except Exception:
                     pass
 
+    @property
+    def _seeded_marker(self) -> str:
+        """Written once the profile is known to hold a logged-in session."""
+        return os.path.join(self.profile_dir, PROFILE_SEEDED_MARKER)
+
+    def _mark_seeded(self):
+        try:
+            Path(self._seeded_marker).touch()
+        except OSError:
+            pass  # Next run just injects the cookie JSON again
+
     def clear_cookies(self):
-        """Delete saved cookie file for re-login."""
+        """Delete saved cookie file and browser profile for re-login."""
         if os.path.exists(self.cookie_path):
             os.remove(self.cookie_path)
             logger.info("TikTok: ลบ cookie แล้ว")
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
 
     def upload(self, request: UploadRequest,
                progress_callback: Optional[Callable[[float], None]] = None) -> UploadResult:
@@ -887,6 +1054,7 @@ class TikTokBrowserUploader:
                 platform="TikTok",
                 status=UploadStatus.FAILED,
                 error="ยังไม่ได้ login TikTok — ไปที่ตั้งค่า > Login TikTok",
+                retryable=False,
             )
 
         if not os.path.exists(request.video_path):
@@ -894,35 +1062,40 @@ class TikTokBrowserUploader:
                 platform="TikTok",
                 status=UploadStatus.FAILED,
                 error=f"ไม่พบไฟล์วิดีโอ: {request.video_path}",
+                retryable=False,
             )
 
         video_path = str(Path(request.video_path).resolve())
         driver = None
 
         try:
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.common.keys import Keys
-
             logger.info(f"TikTok: เริ่มอัปโหลด '{request.title}'...")
-            driver = _create_edge_driver(headless=False)
+            # A profile whose session was verified before already holds it —
+            # cookie JSON is only injected into an unverified profile
+            profile_seeded = os.path.exists(self._seeded_marker)
+            driver = _create_edge_driver(headless=False, profile_dir=self.profile_dir)
 
             # Step 1: Load cookies
-            if not _load_cookies(driver, self.cookie_path):
-                return UploadResult(
-                    platform="TikTok",
-                    status=UploadStatus.FAILED,
-                    error="โหลด cookie ไม่ได้ — ลอง login ใหม่",
-                )
+            cookies_injected = False
+            if not profile_seeded:
+                if not _load_cookies(driver, self.cookie_path):
+                    return UploadResult(
+                        platform="TikTok",
+                        status=UploadStatus.FAILED,
+                        error="โหลด cookie ไม่ได้ — ลอง login ใหม่",
+                        retryable=False,
+                    )
+                cookies_injected = True
 
             # Step 2: Navigate to upload page
-            driver.get(TIKTOK_UPLOAD_URL)
-            # Wait for page to be interactive (not just loaded)
-            WebDriverWait(driver, 15).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
-            )
-            time.sleep(2)
+            _open_upload_page(driver)
+
+            # The profile may have lost the session (e.g. cookies without an
+            # expiry aren't kept on disk) — re-inject the cookie JSON and retry once
+            if "/login" in driver.current_url and not cookies_injected:
+                logger.info("TikTok: session ใน profile หาย — โหลด cookie แล้วลองใหม่")
+                if _load_cookies(driver, self.cookie_path):
+                    _open_upload_page(driver)
 
             # Step 3: Check if still logged in (redirected to login = session expired)
             if "/login" in driver.current_url:
@@ -931,8 +1104,11 @@ class TikTokBrowserUploader:
                     platform="TikTok",
                     status=UploadStatus.FAILED,
                     error="Session หมดอายุ — กรุณา login ใหม่ในตั้งค่า",
+                    retryable=False,
                 )
 
+            self._mark_seeded()
+
             if progress_callback:
                 progress_callback(0.1)
 
@@ -966,7 +1142,8 @@ class TikTokBrowserUploader:
 
             # Dismiss overlays again (TikTok may show tutorial after file select)
             _dismiss_overlays(driver)
-            time.sleep(1)
+            _wait_until(driver, lambda d: not d.find_elements(
+                By.CSS_SELECTOR, '.react-joyride__overlay'), timeout=2)
 
             if progress_callback:
                 progress_callback(0.5)
@@ -976,7 +1153,7 @@ class TikTokBrowserUploader:
             if request.description:
                 caption = f"{caption}\n{request.description}"
             if request.tags:
-                caption += "\n" + " ".join(f"#{t}" for t in request.tags)
+                caption += "\n" + render_hashtags(request.tags)
 
             try:
                 # TikTok's caption editor — DraftEditor or newer editor
@@ -1007,8 +1184,8 @@ class TikTokBrowserUploader:
                         continue
 
                 if caption_input:
+                    # _fill_caption returns once the text is in the editor
                     _fill_caption(driver, caption_input, caption[:2200])
-                    time.sleep(1)
                     actual = driver.execute_script(
                         "return arguments[0].textContent.trim();", caption_input)
                     logger.info(f"TikTok: กรอก caption แล้ว ({len(actual)} chars)")
@@ -1056,7 +1233,7 @@ class TikTokBrowserUploader:
                 if post_btn:
                     # Use JS click to bypass any overlay
                     driver.execute_script("arguments[0].scrollIntoView(true);", post_btn)
-                    time.sleep(1)
+                    _wait_until(driver, EC.element_to_be_clickable(post_btn), timeout=3)
                     driver.execute_script("arguments[0].click();", post_btn)
                     logger.info(f"TikTok: กดปุ่ม {btn_label} แล้ว")
                 else:
@@ -1080,13 +1257,13 @@ class TikTokBrowserUploader:
             # (only for immediate posts — scheduled posts don't show this)
             if not is_scheduled:
                 try:
-                    post_now_btn = WebDriverWait(driver, 15).until(
+                    post_now_btn = WebDriverWait(driver, 15, poll_frequency=_FAST_POLL).until(
                         EC.presence_of_element_located((
                             By.XPATH,
                             '//button[contains(text(), "Post") and contains(text(), "now")]'
                         ))
                     )
-                    time.sleep(0.5)
+                    _wait_until(driver, EC.element_to_be_clickable(post_now_btn), timeout=2)
                     driver.execute_script("arguments[0].click();", post_now_btn)
                     logger.info("TikTok: กดปุ่ม 'Post now' (confirm dialog) แล้ว")
                 except Exception:
@@ -1127,6 +1304,7 @@ class TikTokBrowserUploader:
                 platform="TikTok",
                 status=UploadStatus.FAILED,
                 error="ต้องติดตั้ง: pip install selenium",
+                retryable=False,
             )
 
         except Exception as e:
@@ -21,7 +21,8 @@ from typing import Optional, Callable
 
 import requests
 
-from . import UploadResult, UploadStatus, UploadRequest, ProgressFileReader
+from . import (UploadResult, UploadStatus, UploadRequest, ProgressFileReader,
+               render_hashtags, video_file_size)
 
 logger = logging.getLogger(__name__)
 
@@ -188,23 +189,24 @@ class TikTokUploader:
                     platform="TikTok",
                     status=UploadStatus.FAILED,
                     error="ยังไม่ได้เชื่อมต่อ TikTok — ตั้งค่า OAuth ก่อน",
+                    retryable=False,
                 )
 
-        if not os.path.exists(request.video_path):
+        file_size = video_file_size(request.video_path)  # one stat: exists + size
+        if file_size is None:
             return UploadResult(
                 platform="TikTok",
                 status=UploadStatus.FAILED,
                 error=f"ไม่พบไฟล์วิดีโอ: {request.video_path}",
+                retryable=False,
             )
 
-        file_size = os.path.getsize(request.video_path)
-
         # Build caption with hashtags
         caption = request.title
         if request.description:
             caption = f"{request.title} {request.description}"
         if request.tags:
-            caption += " " + " ".join(f"#{t}" for t in request.tags)
+            caption += " " + render_hashtags(request.tags)
 
         # Map privacy
         privacy_map = {
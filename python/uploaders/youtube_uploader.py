@@ -14,7 +14,7 @@ import json
 import logging
 from typing import Optional, Callable
 
-from . import UploadResult, UploadStatus, UploadRequest
+from . import UploadResult, UploadStatus, UploadRequest, render_hashtags
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +98,7 @@ class YouTubeUploader:
                 platform="YouTube",
                 status=UploadStatus.FAILED,
                 error="ต้องติดตั้ง google-api-python-client",
+                retryable=False,
             )
 
         if not self.service:
@@ -106,6 +107,7 @@ class YouTubeUploader:
                     platform="YouTube",
                     status=UploadStatus.FAILED,
                     error="ยังไม่ได้เชื่อมต่อ YouTube — ตั้งค่า OAuth ก่อน",
+                    retryable=False,
                 )
 
         if not os.path.exists(request.video_path):
@@ -113,6 +115,7 @@ class YouTubeUploader:
                 platform="YouTube",
                 status=UploadStatus.FAILED,
                 error=f"ไม่พบไฟล์วิดีโอ: {request.video_path}",
+                retryable=False,
             )
 
         # Build title with #Shorts tag
@@ -123,7 +126,7 @@ class YouTubeUploader:
         # Build description with hashtags
         description = request.description or title
         if request.tags:
-            tag_str = " ".join(f"#{t}" for t in request.tags)
+            tag_str = render_hashtags(request.tags)
             description = f"{description}\n\n{tag_str}"
         if "#Shorts" not in description:
             description += "\n#Shorts"
@@ -141,7 +144,7 @@ class YouTubeUploader:
             "snippet": {
                 "title": title[:100],  # YouTube max 100 chars
                 "description": description[:5000],
-                "tags": request.tags or [],
+                "tags": list(request.tags),
                 "categoryId": "10",  # Music
             },
             "status": status_body,
@@ -183,10 +186,13 @@ class YouTubeUploader:
             error_msg = str(e)
             logger.error(f"YouTube: อัปโหลดไม่สำเร็จ — {error_msg}")
             # Translate common errors
+            retryable = True
             if "quota" in error_msg.lower():
                 friendly = "YouTube API quota หมด — ลองอีกครั้งพรุ่งนี้"
+                retryable = False
             elif "forbidden" in error_msg.lower() or "403" in error_msg:
                 friendly = "ไม่มีสิทธิ์อัปโหลด — ตรวจสอบ OAuth scope"
+                retryable = False
             elif "notFound" in error_msg or "404" in error_msg:
                 friendly = "ไม่พบ channel — ตรวจสอบ account"
             elif "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
@@ -197,4 +203,5 @@ class YouTubeUploader:
                 platform="YouTube",
                 status=UploadStatus.FAILED,
                 error=friendly,
+                retryable=retryable,
             )
@@ -6,6 +6,8 @@ suites = [
     "test_classify_url",
     "test_gui_feedback",
     "test_tier2",
+    "test_uploaders",
+    "test_mood_detector",
 ]
 
 all_passed = True
@@ -0,0 +1,107 @@
+"""
+Mood detector tests — python/mood_detector.py.
+
+mood_detector only needs the stdlib, so it is loaded straight from its file
+(importing the `python` package would pull in requests via kie_generator).
+"""
+import importlib.util
+import os
+
+_spec = importlib.util.spec_from_file_location(
+    "mood_detector", os.path.join(os.path.dirname(os.path.abspath(__file__)), "python", "mood_detector.py"))
+mood_detector = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(mood_detector)
+
+
+# (artist, title, expected {mood, intensity, vibe}, label)
+DETECT_TESTS = [
+    ("Artist", "Happy Days", {"mood": "happy", "intensity": "medium", "vibe": "studio"},
+     "single happy keyword"),
+    ("Sad Song", "Broken Heart", {"mood": "sad", "intensity": "medium", "vibe": "studio"},
+     "mood uses title only — 'broken' beats artist's 'sad'"),
+    ("Band", "Heartbreak Goodbye", {"mood": "sad", "intensity": "medium", "vibe": "studio"},
+     "'heart' inside 'heartbreak' counts for romantic, sad still wins 2-1"),
+    ("Band", "Love Song", {"mood": "happy", "intensity": "medium", "vibe": "studio"},
+     "'love' in happy + romantic — tie goes to earlier mood"),
+    ("Band", "Sweet Love Dream", {"mood": "romantic", "intensity": "medium", "vibe": "studio"},
+     "romantic 3 vs happy 1"),
+    ("Band", "Love love love", {"mood": "happy", "intensity": "medium", "vibe": "studio"},
+     "repeated keyword counts once"),
+    ("Rock Band", "Epic Battle", {"mood": "energetic", "intensity": "high", "vibe": "studio"},
+     "epic -> energetic + high"),
+    ("Soft Cell", "Tainted", {"mood": "calm", "intensity": "low", "vibe": "studio"},
+     "intensity reads artist too"),
+    ("Band", "Super Soft (Live)", {"mood": "calm", "intensity": "high", "vibe": "live"},
+     "high checked before low"),
+    ("Band", "Live Remix", {"mood": "calm", "intensity": "medium", "vibe": "live"},
+     "live checked before remix"),
+    ("Band", "Song (Cover Version)", {"mood": "calm", "intensity": "medium", "vibe": "remix"},
+     "cover -> remix"),
+    ("", "", {"mood": "calm", "intensity": "medium", "vibe": "studio"},
+     "empty -> defaults"),
+    ("Band", "EXPLOSIVE ELECTRIC", {"mood": "energetic", "intensity": "medium", "vibe": "studio"},
+     "case-insensitive"),
+]
+
+# (title, expected {artist, song}, label)
+METADATA_TESTS = [
+    ("Artist - Song", {"artist": "Artist", "song": "Song"}, "dash split"),
+    ("Artist | Song", {"artist": "Artist", "song": "Song"}, "pipe split"),
+    ("A | B - C", {"artist": "A | B", "song": "C"}, "dash preferred over earlier pipe"),
+    ("A - B - C", {"artist": "A", "song": "B - C"}, "split at first dash only"),
+    ("A-B", {"artist": "Unknown Artist", "song": "A-B"}, "dash needs spaces"),
+    ("  Just a Song  ", {"artist": "Unknown Artist", "song": "Just a Song"}, "no separator -> strip"),
+    ("ศิลปิน - เพลง\n(Official)", {"artist": "ศิลปิน", "song": "เพลง\n(Official)"}, "Thai + newline in song"),
+]
+
+
+def run_tests():
+    passed = 0
+    failed = 0
+    detector = mood_detector.MoodDetector()
+
+    print("=== Mood Detection Tests ===\n")
+    for artist, title, expected, label in DETECT_TESTS:
+        actual = detector.detect_from_artist_title(artist, title)
+        if actual == expected:
+            passed += 1
+            print(f"  PASS  {label}")
+        else:
+            failed += 1
+            print(f"  FAIL  {label}")
+            print(f"        Expected: {expected}")
+            print(f"        Got:      {actual}")
+
+    print(f"\n=== detect_mood() Tests ===\n")
+    for artist, title, expected, label in DETECT_TESTS:
+        actual = mood_detector.detect_mood(title)
+        if actual == expected["mood"]:
+            passed += 1
+            print(f"  PASS  {label}")
+        else:
+            failed += 1
+            print(f"  FAIL  {label}")
+            print(f"        Expected: {expected['mood']}")
+            print(f"        Got:      {actual}")
+
+    print(f"\n=== Title Metadata Tests ===\n")
+    for title, expected, label in METADATA_TESTS:
+        actual = mood_detector.extract_metadata_from_title(title)
+        if actual == expected:
+            passed += 1
+            print(f"  PASS  {label}")
+        else:
+            failed += 1
+            print(f"  FAIL  {label}")
+            print(f"        Expected: {expected}")
+            print(f"        Got:      {actual}")
+
+    print(f"\n{'='*50}")
+    print(f"Results: {passed} passed, {failed} failed, {passed + failed} total")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    import sys
+    success = run_tests()
+    sys.exit(0 if success else 1)
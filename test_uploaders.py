@@ -0,0 +1,112 @@
+"""
+Uploader helper tests — retry/backoff logic in python/uploaders/__init__.py.
+
+python/uploaders/__init__.py only needs the stdlib, so it is loaded straight
+from its file (importing the `python` package would pull in requests via
+kie_generator).
+"""
+import importlib.util
+import os
+import types
+
+_spec = importlib.util.spec_from_file_location(
+    "uploaders", os.path.join(os.path.dirname(os.path.abspath(__file__)), "python", "uploaders", "__init__.py"))
+uploaders = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(uploaders)
+
+UploadResult = uploaders.UploadResult
+UploadStatus = uploaders.UploadStatus
+
+
+def _ok(platform):
+    return UploadResult(platform, UploadStatus.SUCCESS)
+
+
+def _fail(platform, error=None, retryable=True):
+    return UploadResult(platform, UploadStatus.FAILED, error=error, retryable=retryable)
+
+
+def run_with_retry(results: list, max_retries: int):
+    """Call the real upload_with_retry with a scripted upload_fn and no real sleeps.
+
+    Returns (final result, calls made, sleeps taken).
+    """
+    calls = []
+    sleeps = []
+
+    def upload_fn():
+        result = results[min(len(calls), len(results) - 1)]
+        calls.append(result)
+        return result
+
+    real_time = uploaders.time
+    uploaders.time = types.SimpleNamespace(sleep=sleeps.append)
+    try:
+        result = uploaders.upload_with_retry(upload_fn, max_retries=max_retries)
+    finally:
+        uploaders.time = real_time
+    return result, len(calls), sleeps
+
+
+# (attempt, base, cap, jitter, expected_min, expected_max, label)
+RETRY_DELAY_TESTS = [
+    (0, 1.0, 30.0, 0.0, 1.0, 1.0, "attempt 0, no jitter -> base"),
+    (2, 1.0, 30.0, 0.0, 4.0, 4.0, "attempt 2, no jitter -> 4x base"),
+    (10, 1.0, 30.0, 0.0, 30.0, 30.0, "large attempt -> capped"),
+    (1, 1.0, 30.0, 0.5, 1.0, 3.0, "attempt 1 with 50% jitter -> 1..3s"),
+    (10, 1.0, 30.0, 0.5, 15.0, 45.0, "capped delay with 50% jitter -> 15..45s"),
+]
+
+# (results, max_retries, expected (status, calls, attempts, sleeps), label)
+RETRY_FLOW_TESTS = [
+    ([_ok("YouTube")], 3, (UploadStatus.SUCCESS, 1, 1, 0), "success first try -> 1 call"),
+    ([_fail("YouTube"), _ok("YouTube")], 3, (UploadStatus.SUCCESS, 2, 2, 1),
+     "transient failure then success -> 2 calls"),
+    ([_fail("Facebook")], 3, (UploadStatus.FAILED, 4, 4, 3),
+     "always failing -> 1 + max_retries calls"),
+    ([_fail("TikTok", "Session หมดอายุ", retryable=False)], 3, (UploadStatus.FAILED, 1, 1, 0),
+     "auth error -> not retried, no sleep"),
+    ([_fail("YouTube"), _fail("YouTube", "quota", retryable=False)], 3, (UploadStatus.FAILED, 2, 2, 1),
+     "transient then auth error -> stop at auth error"),
+]
+
+
+def run_tests():
+    passed = 0
+    failed = 0
+
+    print("=== Retry Delay Tests ===\n")
+    for attempt, base, cap, jitter, lo, hi, label in RETRY_DELAY_TESTS:
+        samples = [uploaders.retry_delay(attempt, base, cap, jitter) for _ in range(200)]
+        ok = all(lo <= d <= hi for d in samples)
+        if ok:
+            passed += 1
+            print(f"  PASS  {label}")
+        else:
+            failed += 1
+            print(f"  FAIL  {label}")
+            print(f"        Expected range: {lo}..{hi}")
+            print(f"        Got:            {min(samples):.2f}..{max(samples):.2f}")
+
+    print(f"\n=== Retry Flow Tests ===\n")
+    for results, max_retries, expected, label in RETRY_FLOW_TESTS:
+        result, calls, sleeps = run_with_retry(results, max_retries)
+        actual = (result.status, calls, result.attempts, len(sleeps))
+        if actual == expected:
+            passed += 1
+            print(f"  PASS  {label}")
+        else:
+            failed += 1
+            print(f"  FAIL  {label}")
+            print(f"        Expected (status, calls, attempts, sleeps): {expected}")
+            print(f"        Got:                                        {actual}")
+
+    print(f"\n{'='*50}")
+    print(f"Results: {passed} passed, {failed} failed, {passed + failed} total")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    import sys
+    success = run_tests()
+    sys.exit(0 if success else 1)